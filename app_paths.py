@@ -3,9 +3,11 @@
 无论开发环境还是打包后的应用，都使用同一个固定的数据目录，
 保证始终读取同一份数据库文件。
 """
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_app_data_dir() -> Path:
     """返回应用数据目录（数据库、配置等持久化文件存放位置）
     
@@ -13,7 +15,13 @@ def get_app_data_dir() -> Path:
     - 开发时和打包后读取同一份数据库
     - 无论应用在哪里运行，都使用固定位置
     - 符合 macOS 应用数据存储的最佳实践
+    
+    结果会被缓存，目录只在首次调用时创建。
     """
     base = Path.home() / "Library" / "Application Support" / "单词卡片"
-    base.mkdir(parents=True, exist_ok=True)
+    try:
+        base.mkdir(parents=True)
+    except FileExistsError:
+        # 常见情况：目录已存在，直接尝试创建比先 stat 再 mkdir 少一次系统调用
+        pass
     return base
@@ -4,6 +4,108 @@
 import json
 from app_paths import get_app_data_dir
 
+_JSON_WHITESPACE = ' \t\r\n'
+_JSON_VALUE_END = ',]}:'  # 对象/数组中一个值之后可能出现的分隔符
+_JSON_DECODER = json.JSONDecoder()
+
+
+class _JsonStreamReader:
+    """按块读取文本文件并逐个解码 JSON 值（只在缓冲区中保留尚未解析的部分）"""
+    
+    def __init__(self, f, chunk_size: int):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+    
+    def _fill(self) -> None:
+        """读取下一块数据，丢弃已解析的部分"""
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+    
+    def peek(self) -> str:
+        """跳过空白，返回下一个字符（文件结束时返回空字符串）"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _JSON_WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf) or self._eof:
+                break
+            self._fill()
+        return self._buf[self._pos:self._pos + 1]
+    
+    def expect(self, *chars: str) -> str:
+        """读取一个分隔符，必须是 chars 之一"""
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise ValueError(f"JSON 格式错误：期望 {' 或 '.join(chars)}，实际为 {ch or '文件结束'}")
+        self._pos += 1
+        return ch
+    
+    def decode(self):
+        """解码下一个完整的 JSON 值"""
+        self.peek()
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                self._fill()
+                continue
+            # 数字可能在任意位置被块边界截断（如 "1." 或 "2e" 后被截断时 raw_decode 会返回较短的
+            # 合法前缀），因此值之后的分隔符（, ] } :）必须已在缓冲区中才能确认
+            after = end
+            while after < len(self._buf) and self._buf[after] in _JSON_WHITESPACE:
+                after += 1
+            if (after == len(self._buf) or self._buf[after] not in _JSON_VALUE_END) and not self._eof:
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+
+def iter_json_array(path, key='words', extras=None, chunk_size=1 << 16):
+    """
+    流式读取 JSON 文件顶层对象中某个数组字段的元素（逐个解码，不构造整个文档）
+    
+    Args:
+        path: JSON 文件路径，内容形如 {"words": [{...}, ...], ...}
+        key: 要逐个产出元素的数组字段名
+        extras: 可选字典，用于收集顶层其他字段的值（遍历结束后填充完整）
+        chunk_size: 每次读取的字符数
+        
+    Raises:
+        ValueError: 文件内容不是合法的 JSON 对象
+    """
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        reader = _JsonStreamReader(f, chunk_size)
+        reader.expect('{')
+        if reader.peek() == '}':
+            return
+        while True:
+            name = reader.decode()
+            reader.expect(':')
+            if name == key and reader.peek() == '[':
+                reader.expect('[')
+                if reader.peek() == ']':
+                    reader.expect(']')
+                else:
+                    while True:
+                        yield reader.decode()
+                        if reader.expect(',', ']') == ']':
+                            break
+            else:
+                value = reader.decode()
+                if extras is not None:
+                    extras[name] = value
+            if reader.expect(',', '}') == '}':
+                return
+
 
 class DataManager:
     """数据管理器"""
@@ -13,15 +115,18 @@ class DataManager:
         self.app_dir = get_app_data_dir()
         self.data_file = self.app_dir / data_file
         
-    def load(self):
-        """从 JSON 文件加载数据（仅用于迁移）"""
+    def count_words(self) -> int:
+        """
+        统计 JSON 文件中的单词数量（流式解析，不构造整个文档，内存占用与文件大小无关）
+        
+        Returns:
+            int: 单词数量，文件不存在或解析失败时为 0
+        """
         if not self.data_file.exists():
-            return None
-            
+            return 0
+        
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return data
+            return sum(1 for _ in iter_json_array(self.data_file, 'words'))
         except Exception as e:
-            print(f"加载数据失败: {e}")
-            return None
+            print(f"读取数据失败: {e}")
+            return 0
@@ -1,18 +1,292 @@
 """
 数据库管理器 - 使用 SQLite 存储单词数据
 """
+import os
+import sys
+import shutil
 import sqlite3
+import queue
 import logging
+import threading
+import ctypes
+import ctypes.util
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Iterator
+from time import sleep
+from datetime import date, datetime, time, timedelta
+from typing import Callable, List, Dict, Optional, Iterator, Iterable, Tuple
 
 from app_paths import get_app_data_dir
+from data_manager import iter_json_array
 
 # 配置日志
 logger = logging.getLogger(__name__)
 
+# 不区分大小写的单词唯一索引：INSERT OR IGNORE 直接在数据库中完成大小写无关的去重，
+# word_exists 也可走索引查找（批量导入时不能删除）
+WORD_NOCASE_INDEX_SQL = 'CREATE UNIQUE INDEX IF NOT EXISTS idx_word_nocase ON words(word COLLATE NOCASE)'
+
+# 辅助索引（不含单词唯一索引），批量导入时可临时删除后重建
+# idx_word_state 覆盖统计查询用到的全部列，get_statistics 只扫描这个小索引而不读整张表，
+# 待复习单词的查询也按 (mastered, next_review) 在其中范围查找；
+# idx_new_words 只包含未复习过的单词，get_new_words 无需扫描整张表
+AUX_INDEXES = {
+    'idx_word_state': 'CREATE INDEX IF NOT EXISTS idx_word_state ON words(mastered, next_review, review_count)',
+    'idx_new_words': 'CREATE INDEX IF NOT EXISTS idx_new_words ON words(id) WHERE review_count = 0',
+}
+
+# 已被取代的旧索引（idx_word 与 UNIQUE 约束的自动索引重复；
+# 两个 next_review 部分索引已被 idx_word_state 完全取代），启动时删除
+OBSOLETE_INDEXES = (
+    'idx_word', 'idx_next_review', 'idx_mastered',
+    'idx_due_review', 'idx_mastered_review',
+)
+
+# 单词表结构：所有时间列均为 INTEGER Unix 时间戳（秒），比较与索引都比 ISO 字符串更小更快
+WORDS_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        word TEXT NOT NULL UNIQUE,
+        meaning TEXT NOT NULL,
+        review_count INTEGER DEFAULT 0,
+        ease_factor REAL DEFAULT 2.5,
+        interval_days INTEGER DEFAULT 1,
+        next_review INTEGER,
+        mastered INTEGER DEFAULT 0,
+        last_review INTEGER,
+        created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+        updated_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+    )
+'''
+
+# 单词字典的键（interval_days 对外统一叫 interval），与 WORD_SELECT_COLUMNS 顺序一致
+WORD_COLUMNS = (
+    'id', 'word', 'meaning', 'review_count', 'ease_factor', 'interval',
+    'next_review', 'mastered', 'last_review', 'created_at', 'updated_at'
+)
+WORD_SELECT_COLUMNS = (
+    'id, word, meaning, review_count, ease_factor, interval_days, '
+    'next_review, mastered, last_review, created_at, updated_at'
+)
+
+
+def _word_row_factory(cursor: sqlite3.Cursor, row: tuple) -> Dict:
+    """单词查询的行工厂：按固定列顺序直接构造字典，mastered 转为布尔值"""
+    result = dict(zip(WORD_COLUMNS, row))
+    result['mastered'] = bool(result['mastered'])
+    return result
+
+
+# 一天的秒数
+SECONDS_PER_DAY = 86400
+
+# 多行 VALUES 插入时每条语句包含的行数（5 列 × 100 行 = 500 个参数，低于 SQLite 默认的 999 上限）
+INSERT_CHUNK_ROWS = 100
+
+
+@lru_cache(maxsize=8)
+def _multi_values_sql(n_rows: int, n_cols: int = 5) -> str:
+    """生成一次插入 n_rows 行的 INSERT OR IGNORE 语句（按行数缓存，整块与尾块各一条）"""
+    row = '(' + ','.join(['?'] * n_cols) + ')'
+    return (
+        'INSERT OR IGNORE INTO words (word, meaning, next_review, created_at, updated_at) '
+        'VALUES ' + ','.join([row] * n_rows)
+    )
+
+
+def to_timestamp(value) -> Optional[int]:
+    """将 ISO 字符串、datetime 或数字统一转换为 Unix 时间戳（秒），无法解析时返回 None"""
+    if isinstance(value, str):
+        # 最常见的情况：ISO 字符串
+        try:
+            return int(datetime.fromisoformat(value).timestamp())
+        except ValueError:
+            return None
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if isinstance(value, (int, float)):
+        return int(value)
+    return None
+
+
+def clone_file(src: Path, dst: Path) -> None:
+    """
+    复制文件：macOS 上优先用 clonefile 创建写时复制克隆（APFS 只更新元数据，不拷贝数据块），
+    不支持时（非 APFS、跨卷或其他系统）回退到 shutil.copy2
+    """
+    if sys.platform == 'darwin':
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                return
+            logger.debug(f"clonefile 不可用（errno={ctypes.get_errno()}），改为普通复制")
+        except (OSError, AttributeError):
+            pass
+    shutil.copy2(src, dst)
+
+
+# JSON 迁移写入语句（按单词覆盖）
+MIGRATE_WORD_SQL = '''
+    INSERT OR REPLACE INTO words
+    (word, meaning, review_count, ease_factor, interval_days,
+     next_review, mastered, last_review, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def _migrate_row(word_data: Dict, now: int) -> tuple:
+    """将旧版 JSON 中的单词字典转换为 MIGRATE_WORD_SQL 的参数（now 由调用方预先计算）"""
+    # ISO 字符串转换为时间戳，无法解析时复习时间取当前时间
+    next_review = to_timestamp(word_data.get('next_review'))
+    if next_review is None:
+        next_review = now
+    return (
+        word_data.get('word', ''),
+        word_data.get('meaning', ''),
+        word_data.get('review_count', 0),
+        word_data.get('ease_factor', 2.5),
+        word_data.get('interval', 1),
+        next_review,
+        1 if word_data.get('mastered', False) else 0,
+        to_timestamp(word_data.get('last_review')),
+        now,
+        now
+    )
+
+
+def day_start_timestamp(offset_days: int = 0) -> int:
+    """返回本地日期（今天 + offset_days）零点的时间戳"""
+    day = date.today() + timedelta(days=offset_days)
+    return int(datetime.combine(day, time.min).timestamp())
+
+
+# SQLite 的 NOCASE 只折叠 ASCII 字母（É 与 é 视为不同），内存中的查重需使用相同规则
+_NOCASE_TABLE = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+
+def nocase_key(word: str) -> str:
+    """返回与 COLLATE NOCASE 比较规则一致的单词查重键（只将 ASCII 大写字母转为小写）"""
+    return word.translate(_NOCASE_TABLE)
+
+
+# 数据库被其他连接锁住（SQLITE_BUSY）时，后台写线程重试的次数和每次重试前的等待秒数
+# （每次尝试本身还会按连接的 busy timeout 等待锁）
+WRITE_RETRIES = 3
+WRITE_RETRY_DELAY = 0.5
+# flush() 等待写线程时检查其是否仍在运行的间隔（秒）
+FLUSH_POLL_INTERVAL = 0.5
+
+
+def _is_busy_error(error: Exception) -> bool:
+    """是否为数据库被占用（database is locked / busy）导致的错误，可稍后重试"""
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    message = str(error).lower()
+    return 'locked' in message or 'busy' in message
+
+
+class WriterThread(threading.Thread):
+    """
+    后台写线程：在独立连接上执行界面产生的小写操作
+    
+    调用方提交的每一组写操作（SQL + 参数）在各自的 BEGIN IMMEDIATE 事务中执行：
+    组内全部生效或全部回滚，一组失败不影响其他调用方的写操作。WAL + synchronous=NORMAL
+    下提交不做 fsync，逐组提交的开销很小。数据库被占用时按 WRITE_RETRIES 重试，
+    仍然失败的组交给 on_error(错误, 写操作) 处理。每个事务都在 write_lock 下执行，
+    与批量导入的提交互斥，不会互相等到 busy timeout。WAL 模式下读连接不会被写事务阻塞。
+    """
+    
+    _STOP = object()  # 执行完剩余写操作后退出
+    
+    def __init__(self, connect: Callable[[], sqlite3.Connection],
+                 on_error: Callable[[Exception, List[Tuple[str, tuple]]], None],
+                 write_lock: threading.Lock):
+        super().__init__(name='db-writer', daemon=True)
+        self._connect = connect
+        self._on_error = on_error
+        self._write_lock = write_lock
+        self._queue: queue.Queue = queue.Queue()
+        # 已提交但尚未执行完的写操作组数，归零时唤醒 flush()
+        self._pending = 0
+        self._idle = threading.Condition()
+    
+    def submit(self, sql: str, params: tuple = ()) -> None:
+        """提交一个写操作（立即返回，不等待执行）"""
+        self.submit_group([(sql, params)])
+    
+    def submit_group(self, ops: List[Tuple[str, tuple]]) -> None:
+        """提交一组必须在同一事务中执行的写操作（立即返回，不等待执行）"""
+        with self._idle:
+            self._pending += 1
+        self._queue.put(list(ops))
+    
+    def flush(self) -> None:
+        """
+        等待已提交的写操作全部执行完毕（没有排队的写操作时立即返回）
+        
+        Raises:
+            sqlite3.OperationalError: 写线程已退出，排队的写操作不会再执行
+        """
+        with self._idle:
+            while self._pending:
+                if not self.is_alive():
+                    raise sqlite3.OperationalError(
+                        f"后台写线程已退出，{self._pending} 组写操作未执行"
+                    )
+                self._idle.wait(FLUSH_POLL_INTERVAL)
+    
+    def stop(self) -> None:
+        """执行完剩余写操作并结束线程"""
+        self._queue.put(self._STOP)
+        self.join()
+    
+    def run(self) -> None:
+        try:
+            conn = self._connect()
+        except Exception as e:
+            # 线程随即退出，flush() 会发现并报错，下一次提交写操作时重新启动写线程
+            logger.error(f"后台写线程无法打开数据库: {e}", exc_info=True)
+            self._on_error(e, [])
+            return
+        while True:
+            ops = self._queue.get()
+            if ops is self._STOP:
+                return
+            try:
+                self._execute_group(conn, ops)
+            finally:
+                with self._idle:
+                    self._pending -= 1
+                    if not self._pending:
+                        self._idle.notify_all()
+    
+    def _execute_group(self, conn: sqlite3.Connection, ops: List[Tuple[str, tuple]]) -> None:
+        """在一个事务中执行一组写操作，数据库被占用时重试，最终失败时回滚并报告"""
+        for attempt in range(1, WRITE_RETRIES + 1):
+            try:
+                with self._write_lock:
+                    conn.execute('BEGIN IMMEDIATE')
+                    try:
+                        for sql, params in ops:
+                            conn.execute(sql, params)
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+                return
+            except Exception as e:
+                if _is_busy_error(e) and attempt < WRITE_RETRIES:
+                    logger.warning(f"数据库被占用，第 {attempt} 次重试写入: {e}")
+                    sleep(WRITE_RETRY_DELAY)
+                    continue
+                logger.error(f"后台写入失败，已回滚 {len(ops)} 个写操作: {e}", exc_info=True)
+                self._on_error(e, ops)
+                return
+
 
 class DatabaseManager:
     """数据库管理器 - 使用 SQLite"""
@@ -23,6 +297,23 @@ class DatabaseManager:
         self.app_dir = get_app_data_dir()
         self.db_file = self.app_dir / db_file
         
+        # 每个线程复用一个长连接，避免每次操作都重新打开数据库文件
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        
+        # 界面产生的小写操作交给后台写线程提交（首次写入时启动）
+        self._writer: Optional[WriterThread] = None
+        self._writer_lock = threading.Lock()
+        # 写事务互斥锁：后台写线程的每个事务与批量导入的每次提交轮流持有，
+        # 导入线程的写事务不会让写线程（以及等待它的界面读操作）卡在 busy timeout 上
+        self._write_lock = threading.Lock()
+        
+        # 后台写入最终失败时的处理函数（在写线程中调用，参数为异常）；
+        # 未设置时失败被记录下来，由下一次 flush_writes() 抛出
+        self.on_write_error: Optional[Callable[[Exception], None]] = None
+        self._write_errors: List[Exception] = []
+        
         # 自动迁移：如果项目目录下有数据库但目标位置没有，自动迁移
         self._migrate_from_project_dir(db_file)
         
@@ -36,22 +327,121 @@ class DatabaseManager:
             
             # 如果项目目录下有数据库，且目标位置没有数据库，则迁移
             if project_db.exists() and not self.db_file.exists():
-                import shutil
                 logger.info(f"检测到项目目录下的数据库，正在迁移到: {self.db_file}")
-                shutil.copy2(project_db, self.db_file)
+                clone_file(project_db, self.db_file)
                 logger.info("数据库迁移完成")
         except Exception as e:
             logger.warning(f"数据库迁移失败（可忽略）: {e}")
     
     def get_connection(self) -> sqlite3.Connection:
-        """获取数据库连接"""
-        conn = sqlite3.connect(self.db_file)
-        conn.row_factory = sqlite3.Row  # 使查询结果可以通过列名访问
+        """获取当前线程的数据库连接（首次调用时创建，之后复用）"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            conn.row_factory = sqlite3.Row  # 使查询结果可以通过列名访问
+            # WAL 日志 + NORMAL 同步级别，临时表放内存，约 64MB 页缓存
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA cache_size=-64000')
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
         return conn
     
+    def release_connection(self) -> None:
+        """关闭当前线程的数据库连接（临时工作线程结束前调用，长期运行的线程不必调用）"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            return
+        self._local.conn = None
+        with self._connections_lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        conn.close()
+    
+    def _submit_write(self, sql: str, params: tuple = ()) -> None:
+        """将写操作交给后台写线程（不阻塞调用方；在 transaction() 块内时先暂存）"""
+        pending = getattr(self._local, 'pending_writes', None)
+        if pending is not None:
+            pending.append((sql, params))
+            return
+        self._submit_writes([(sql, params)])
+    
+    def _submit_writes(self, ops: List[Tuple[str, tuple]]) -> None:
+        """将一组写操作交给后台写线程，在同一个事务中执行"""
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = WriterThread(
+                    self.get_connection, self._report_write_error, self._write_lock
+                )
+                self._writer.start()
+            self._writer.submit_group(ops)
+    
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        将块内的后台写操作（update_word、add_review_record 等）合并为一组，
+        由写线程在同一个事务中执行：全部生效或全部回滚，且只需一次提交
+        
+        块内出现异常时丢弃这些写操作；嵌套使用时并入最外层。
+        注意块内的读操作看不到这些尚未提交的写入。
+        """
+        if getattr(self._local, 'pending_writes', None) is not None:
+            yield
+            return
+        pending = self._local.pending_writes = []
+        try:
+            yield
+        finally:
+            self._local.pending_writes = None
+        if pending:
+            self._submit_writes(pending)
+    
+    def _report_write_error(self, error: Exception, ops: List[Tuple[str, tuple]]) -> None:
+        """后台写线程中一组写操作最终失败（已回滚）：交给 on_write_error，或留给 flush_writes 抛出"""
+        handler = self.on_write_error
+        if handler is not None:
+            handler(error)
+        else:
+            with self._writer_lock:
+                self._write_errors.append(error)
+    
+    def flush_writes(self) -> None:
+        """
+        等待后台写线程执行完所有已排队的写操作（队列为空时不等待写线程）
+        
+        Raises:
+            sqlite3.Error: 未设置 on_write_error 时，抛出上次调用以来第一个失败的写操作的异常；
+                写线程已退出时抛出 OperationalError
+        """
+        writer = self._writer
+        stopped = None
+        if writer is not None:
+            try:
+                writer.flush()
+            except sqlite3.OperationalError as e:
+                stopped = e
+        with self._writer_lock:
+            errors, self._write_errors = self._write_errors, []
+        # 写线程异常退出时，它报告的原因（如无法打开数据库）比"已退出"更有用，优先抛出
+        if stopped is not None:
+            errors.append(stopped)
+        if errors:
+            raise errors[0]
+    
     @contextmanager
-    def _db_connection(self) -> Iterator[sqlite3.Connection]:
-        """数据库连接上下文管理器，自动处理连接关闭和错误"""
+    def _db_connection(self, wait_writes: bool = True) -> Iterator[sqlite3.Connection]:
+        """
+        数据库连接上下文管理器，出错时自动回滚（连接保持打开，供后续操作复用）
+        
+        Args:
+            wait_writes: 是否先等待排队中的写操作执行完。需要读到自己刚提交的写入、
+                或直接写入必须排在这些写操作之后时为 True；WAL 下普通读取不受写线程阻塞，
+                可以看到稍旧数据的读取传 False，不必等待写线程
+        """
+        if wait_writes:
+            self.flush_writes()
         conn = self.get_connection()
         try:
             yield conn
@@ -59,8 +449,18 @@ class DatabaseManager:
             conn.rollback()
             logger.error(f"数据库操作失败: {e}", exc_info=True)
             raise
-        finally:
+    
+    def close(self) -> None:
+        """提交排队的写操作并关闭所有线程的数据库连接（应用退出时调用）"""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.stop()
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
             conn.close()
+        self._local = threading.local()
     
     def init_database(self) -> None:
         """初始化数据库表结构"""
@@ -68,26 +468,21 @@ class DatabaseManager:
             cursor = conn.cursor()
             
             # 创建单词表
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS words (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    word TEXT NOT NULL UNIQUE,
-                    meaning TEXT NOT NULL,
-                    review_count INTEGER DEFAULT 0,
-                    ease_factor REAL DEFAULT 2.5,
-                    interval_days INTEGER DEFAULT 1,
-                    next_review TEXT,
-                    mastered INTEGER DEFAULT 0,
-                    last_review TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
+            cursor.execute(WORDS_TABLE_SQL.format(table='words'))
+            
+            # 旧版数据库的时间列为 ISO 字符串，一次性转换为时间戳
+            self._migrate_timestamp_columns(cursor)
             
             # 创建索引以提高查询性能
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_word ON words(word)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_next_review ON words(next_review)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_mastered ON words(mastered)')
+            for name in OBSOLETE_INDEXES:
+                cursor.execute(f'DROP INDEX IF EXISTS {name}')
+            for index_sql in AUX_INDEXES.values():
+                cursor.execute(index_sql)
+            try:
+                cursor.execute(WORD_NOCASE_INDEX_SQL)
+            except sqlite3.IntegrityError:
+                # 旧数据中存在仅大小写不同的重复单词，保留数据，只是无法在数据库层面去重
+                logger.warning("存在仅大小写不同的重复单词，未创建不区分大小写的唯一索引")
             
             # 创建学习记录表
             cursor.execute('''
@@ -99,6 +494,11 @@ class DatabaseManager:
                     FOREIGN KEY (word_id) REFERENCES words(id)
                 )
             ''')
+            # 最近学习记录按时间倒序读取前 N 条，索引顺序与 ORDER BY 一致，无需排序
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_review_time
+                ON review_history(review_time DESC, word_id)
+            ''')
             
             # 创建应用状态表（存储当前索引等）
             cursor.execute('''
@@ -117,12 +517,47 @@ class DatabaseManager:
             conn.commit()
             logger.info("数据库初始化完成")
     
+    def _migrate_timestamp_columns(self, cursor: sqlite3.Cursor) -> None:
+        """将旧版 TEXT 时间列的单词表重建为 INTEGER 时间戳列（已是新结构时直接返回）"""
+        columns = {row['name']: row['type'] for row in cursor.execute('PRAGMA table_info(words)')}
+        if columns.get('next_review', '').upper() != 'TEXT':
+            return
+        
+        logger.info("正在将单词表的时间列转换为时间戳...")
+        # TEXT 亲和性的列会把整数存成字符串，因此必须重建表而不能原地更新
+        cursor.execute('DROP TABLE IF EXISTS words_new')
+        cursor.execute(WORDS_TABLE_SQL.format(table='words_new'))
+        rows = cursor.execute('''
+            SELECT id, word, meaning, review_count, ease_factor, interval_days,
+                   next_review, mastered, last_review, created_at, updated_at
+            FROM words
+        ''').fetchall()
+        cursor.executemany('''
+            INSERT INTO words_new
+            (id, word, meaning, review_count, ease_factor, interval_days,
+             next_review, mastered, last_review, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            tuple(row[:6]) + (
+                to_timestamp(row['next_review']),
+                row['mastered'],
+                to_timestamp(row['last_review']),
+                to_timestamp(row['created_at']),
+                to_timestamp(row['updated_at']),
+            )
+            for row in rows
+        ))
+        cursor.execute('DROP TABLE words')
+        cursor.execute('ALTER TABLE words_new RENAME TO words')
+        logger.info(f"时间列转换完成，共 {len(rows)} 个单词")
+    
     def word_exists(self, word: str) -> bool:
         """检查单词是否已存在（不区分大小写）"""
         with self._db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM words WHERE LOWER(word) = LOWER(?)', (word.strip(),))
-            return cursor.fetchone()[0] > 0
+            # COLLATE NOCASE 与 idx_word_nocase 一致，可直接走索引
+            cursor.execute('SELECT 1 FROM words WHERE word = ? COLLATE NOCASE LIMIT 1', (word.strip(),))
+            return cursor.fetchone() is not None
     
     def add_word(self, word: str, meaning: str) -> Optional[int]:
         """添加单词，返回单词ID"""
@@ -135,8 +570,8 @@ class DatabaseManager:
             
         with self._db_connection() as conn:
             cursor = conn.cursor()
-            now = datetime.now().isoformat()
-            yesterday = (datetime.now() - timedelta(days=1)).isoformat()
+            now = int(datetime.now().timestamp())
+            yesterday = now - SECONDS_PER_DAY
             cursor.execute('''
                 INSERT OR IGNORE INTO words 
                 (word, meaning, next_review, created_at, updated_at)
@@ -145,54 +580,120 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid if cursor.rowcount > 0 else None
     
-    def batch_add_words(self, words_list: List[tuple], batch_size: int = 1000) -> int:
+    def batch_add_words(self, words_list: List[tuple], batch_size: int = 50000,
+                        progress: Optional[Callable[[int], None]] = None) -> int:
         """
         批量添加单词（用于大量导入）
         
         Args:
             words_list: [(word, meaning), ...] 格式的列表
-            batch_size: 每批处理的单词数量
-            
+            batch_size: 每个事务提交的单词数量
+            progress: 每次提交后以已处理的单词数调用（可选）
+        
         Returns:
             int: 成功添加的单词数量
         """
+        # 去除前后空格，跳过空单词或空释义
+        pairs = (
+            (word.strip() if word else '', meaning.strip() if meaning else '')
+            for word, meaning in words_list
+        )
+        added = self.bulk_insert_iter(((w, m) for w, m in pairs if w and m), batch_size, progress)
+        logger.info(f"批量添加完成，成功添加 {added}/{len(words_list)} 个单词")
+        return added
+    
+    def bulk_insert_iter(self, pairs: Iterable[Tuple[str, str]], commit_every: int = 50000,
+                         progress: Optional[Callable[[int], None]] = None) -> int:
+        """
+        从迭代器流式插入单词（不在内存中保留整个待导入列表）
+        
+        整个导入在显式事务（BEGIN IMMEDIATE）中执行，每 commit_every 个单词才提交一次，
+        避免逐批提交带来的大量 fsync；每条语句插入 INSERT_CHUNK_ROWS 行。
+        每个事务持有写事务互斥锁，提交后释放，期间后台写线程排队的写操作可以执行。
+        
+        Args:
+            pairs: 产出 (word, meaning) 的可迭代对象，调用方负责去除空格和空值
+            commit_every: 每个事务提交的单词数量
+            progress: 每次提交后以已处理的单词数调用（可选）
+        
+        Returns:
+            int: 成功添加的单词数量（已存在的单词被 INSERT OR IGNORE 跳过）
+        
+        Raises:
+            Exception: 迭代或写入出错时回滚当前事务并重新抛出原异常；之前的事务已提交，
+                异常上附带 added / processed 属性，为已提交的添加数和处理数
+        """
+        now = int(datetime.now().timestamp())
+        yesterday = now - SECONDS_PER_DAY
+        rows = iter(pairs)
+        added = 0
+        processed = 0
+        # 最近一次提交时的计数，出错时报告给调用方（未提交的部分已回滚）
+        committed_added = 0
+        committed_processed = 0
+        
         with self._db_connection() as conn:
             cursor = conn.cursor()
-            now = datetime.now().isoformat()
-            yesterday = (datetime.now() - timedelta(days=1)).isoformat()
-            
-            total = len(words_list)
-            added = 0
-            
-            for i in range(0, total, batch_size):
-                batch = words_list[i:i + batch_size]
-                for word, meaning in batch:
+            done = False
+            while not done:
+                with self._write_lock:
+                    conn.execute('BEGIN IMMEDIATE')
                     try:
-                        # 去除前后空格
-                        word = word.strip() if word else ''
-                        meaning = meaning.strip() if meaning else ''
-                        if not word or not meaning:
-                            continue
-                        cursor.execute('''
-                            INSERT OR IGNORE INTO words 
-                            (word, meaning, next_review, created_at, updated_at)
-                            VALUES (?, ?, ?, ?, ?)
-                        ''', (word, meaning, yesterday, now, now))
-                        if cursor.rowcount > 0:
-                            added += 1
+                        pending = 0
+                        while pending < commit_every:
+                            chunk = list(islice(rows, INSERT_CHUNK_ROWS))
+                            if not chunk:
+                                done = True
+                                break
+                            params = [
+                                value
+                                for word, meaning in chunk
+                                for value in (word, meaning, yesterday, now, now)
+                            ]
+                            cursor.execute(_multi_values_sql(len(chunk)), params)
+                            added += cursor.rowcount
+                            processed += len(chunk)
+                            pending += len(chunk)
+                        conn.commit()
                     except Exception as e:
-                        logger.warning(f"跳过单词 {word}: {e}")
-                
+                        conn.rollback()
+                        e.added = committed_added
+                        e.processed = committed_processed
+                        raise
+                committed_added = added
+                committed_processed = processed
+                if not done:
+                    logger.info(f"已处理 {processed} 个单词...")
+                    if progress is not None:
+                        progress(processed)
+        if progress is not None:
+            progress(processed)
+        return added
+    
+    @contextmanager
+    def bulk_load_context(self) -> Iterator[None]:
+        """
+        批量导入上下文：进入时删除辅助索引，退出时重建
+        
+        导入期间每次插入只需维护单词的唯一索引（INSERT OR IGNORE 去重依赖它），
+        其余索引在导入结束后一次性重建。
+        """
+        with self._db_connection() as conn:
+            for name in AUX_INDEXES:
+                conn.execute(f'DROP INDEX IF EXISTS {name}')
+            conn.commit()
+        try:
+            yield
+        finally:
+            with self._db_connection() as conn:
+                for index_sql in AUX_INDEXES.values():
+                    conn.execute(index_sql)
                 conn.commit()
-                if (i + batch_size) % 5000 == 0:
-                    logger.info(f"已处理 {min(i + batch_size, total)}/{total} 个单词...")
-            
-            logger.info(f"批量添加完成，成功添加 {added}/{total} 个单词")
-            return added
+                logger.info("批量导入完成，已重建索引")
     
     def get_word_count(self) -> int:
-        """快速获取单词总数（不加载数据）"""
-        with self._db_connection() as conn:
+        """快速获取单词总数（不加载数据；增删单词都是直接写入，不必等待写线程）"""
+        with self._db_connection(wait_writes=False) as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT COUNT(*) FROM words')
             return cursor.fetchone()[0]
@@ -209,46 +710,96 @@ class DatabaseManager:
             conn.commit()
             logger.info("已清空单词库")
     
+    def _word_cursor(self, conn: sqlite3.Connection) -> sqlite3.Cursor:
+        """创建直接返回单词字典的游标（查询需按 WORD_SELECT_COLUMNS 的顺序选择列）"""
+        cursor = conn.cursor()
+        cursor.row_factory = _word_row_factory
+        return cursor
+    
     def get_all_words(self) -> List[Dict]:
         """获取所有单词"""
         with self._db_connection() as conn:
+            cursor = self._word_cursor(conn)
+            cursor.execute(f'SELECT {WORD_SELECT_COLUMNS} FROM words ORDER BY id')
+            return cursor.fetchall()
+    
+    def get_due_words(self, now: int) -> List[Dict]:
+        """
+        获取需要复习的单词（未掌握且复习时间不晚于 now），按 id 排序
+        
+        按 (mastered, next_review) 索引范围查找，只读取到期的单词。
+        
+        Args:
+            now: 当前时间戳
+        """
+        with self._db_connection() as conn:
+            cursor = self._word_cursor(conn)
+            cursor.execute(f'''
+                SELECT {WORD_SELECT_COLUMNS} FROM words
+                WHERE mastered = 0 AND next_review <= ?
+                ORDER BY id
+            ''', (now,))
+            return cursor.fetchall()
+    
+    def get_new_words(self) -> List[Dict]:
+        """获取未复习过的单词（review_count = 0），按 id 排序，走部分索引 idx_new_words"""
+        with self._db_connection() as conn:
+            cursor = self._word_cursor(conn)
+            cursor.execute(
+                f'SELECT {WORD_SELECT_COLUMNS} FROM words WHERE review_count = 0 ORDER BY id'
+            )
+            return cursor.fetchall()
+    
+    def get_word_display_page(self, offset: int, limit: int, tomorrow: int) -> List[Tuple[str, int]]:
+        """
+        分页获取单词列表显示所需的 (word, marker)，顺序与 get_all_words 一致
+        
+        marker 在 SQL 中计算：1 表示需要复习（未掌握且复习时间早于 tomorrow 或为空），
+        2 表示已掌握或暂不需要复习。不等待写线程：刚评分、编辑的行由界面按单词缓存更新。
+        
+        Args:
+            offset: 起始行号（从 0 开始）
+            limit: 最多返回的行数
+            tomorrow: 本地明天零点的时间戳
+        """
+        with self._db_connection(wait_writes=False) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None  # 直接返回元组
             cursor.execute('''
-                SELECT * FROM words ORDER BY id
-            ''')
-            rows = cursor.fetchall()
-            return [self._row_to_dict(row) for row in rows]
+                SELECT word,
+                       CASE WHEN mastered = 0 AND (next_review IS NULL OR next_review < ?)
+                            THEN 1 ELSE 2 END
+                FROM words ORDER BY id
+                LIMIT ? OFFSET ?
+            ''', (tomorrow, limit, offset))
+            return cursor.fetchall()
     
     def get_word_by_id(self, word_id: int) -> Optional[Dict]:
         """根据ID获取单词"""
         with self._db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM words WHERE id = ?', (word_id,))
-            row = cursor.fetchone()
-            return self._row_to_dict(row) if row else None
+            cursor = self._word_cursor(conn)
+            cursor.execute(f'SELECT {WORD_SELECT_COLUMNS} FROM words WHERE id = ?', (word_id,))
+            return cursor.fetchone()
     
     def update_word(self, word_id: int, **kwargs) -> None:
-        """更新单词信息"""
-        with self._db_connection() as conn:
-            cursor = conn.cursor()
-            # 构建更新语句
-            updates = []
-            values = []
-            for key, value in kwargs.items():
-                updates.append(f"{key} = ?")
-                values.append(value)
+        """更新单词信息（由后台写线程执行）"""
+        # 构建更新语句
+        updates = []
+        values = []
+        for key, value in kwargs.items():
+            updates.append(f"{key} = ?")
+            values.append(value)
+        
+        if updates:
+            # 添加 updated_at
+            updates.append("updated_at = ?")
+            values.append(int(datetime.now().timestamp()))
             
-            if updates:
-                # 添加 updated_at
-                updates.append("updated_at = ?")
-                values.append(datetime.now().isoformat())
-                
-                # WHERE id = ? 必须在最后，word_id 也必须在最后
-                sql = f"UPDATE words SET {', '.join(updates)} WHERE id = ?"
-                values.append(word_id)  # word_id 放在最后
-                
-                cursor.execute(sql, values)
-                conn.commit()
+            # WHERE id = ? 必须在最后，word_id 也必须在最后
+            sql = f"UPDATE words SET {', '.join(updates)} WHERE id = ?"
+            values.append(word_id)  # word_id 放在最后
+            
+            self._submit_write(sql, tuple(values))
     
     def delete_word(self, word_id: int) -> None:
         """删除单词"""
@@ -270,72 +821,58 @@ class DatabaseManager:
             return int(row['value']) if row else 0
     
     def set_current_index(self, index: int) -> None:
-        """设置当前索引"""
-        with self._db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO app_state (key, value) 
-                VALUES ('current_index', ?)
-            ''', (str(index),))
-            conn.commit()
+        """设置当前索引（由后台写线程执行）"""
+        self._submit_write('''
+            INSERT OR REPLACE INTO app_state (key, value) 
+            VALUES ('current_index', ?)
+        ''', (str(index),))
     
-    def add_review_record(self, word_id: int, rating: int) -> None:
-        """添加学习记录"""
-        with self._db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO review_history (word_id, rating, review_time)
-                VALUES (?, ?, ?)
-            ''', (word_id, rating, datetime.now().isoformat()))
-            conn.commit()
+    def add_review_record(self, word_id: int, rating: int,
+                          review_time: Optional[datetime] = None) -> None:
+        """添加学习记录（由后台写线程执行；review_time 默认为当前时间）"""
+        if review_time is None:
+            review_time = datetime.now()
+        self._submit_write('''
+            INSERT INTO review_history (word_id, rating, review_time)
+            VALUES (?, ?, ?)
+        ''', (word_id, rating, review_time.isoformat()))
     
     def get_review_history(self, limit: int = 20) -> List[Dict]:
         """获取最近的学习记录"""
         with self._db_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
-                SELECT rh.*, w.word, w.meaning
+                SELECT rh.id, rh.word_id, rh.rating, rh.review_time, w.word, w.meaning
                 FROM review_history rh
                 JOIN words w ON rh.word_id = w.id
                 ORDER BY rh.review_time DESC
                 LIMIT ?
             ''', (limit,))
-            rows = cursor.fetchall()
-            return [self._row_to_dict(row) for row in rows]
+            return [dict(row) for row in cursor.fetchall()]
     
     def get_statistics(self) -> Dict:
         """快速获取统计信息（使用数据库查询，不加载全部数据）"""
         with self._db_connection() as conn:
             cursor = conn.cursor()
-            # 使用日期字符串比较（ISO格式：YYYY-MM-DD）
-            today = datetime.now().date().isoformat()
-            
-            # 总单词数
-            cursor.execute('SELECT COUNT(*) FROM words')
-            total = cursor.fetchone()[0]
-            
-            # 新单词数（review_count = 0）
-            cursor.execute('SELECT COUNT(*) FROM words WHERE review_count = 0')
-            new_count = cursor.fetchone()[0]
+            # 按本地日期比较：next_review 早于明天零点即为“今天或之前”
+            tomorrow = day_start_timestamp(1)
             
-            # 待复习数量（next_review <= today 或 next_review IS NULL）
-            # 用 SUBSTR(next_review,1,10) 取日期部分，避免 SQLite 对 ISO 带 T 格式解析不一致（重启后统计不准）
+            # 一次扫描同时计算全部计数（条件聚合，扫描覆盖索引 idx_word_state）：
+            # - 总单词数
+            # - 新单词数（review_count = 0）
+            # - 待复习数量（未掌握，且 next_review <= today 或 next_review IS NULL）
+            # - 已掌握数量（mastered = 1）
+            # - 总掌握数（mastered=1 或 next_review 的日期 > today）
             cursor.execute('''
-                SELECT COUNT(*) FROM words 
-                WHERE next_review IS NULL OR SUBSTR(next_review, 1, 10) <= ?
-            ''', (today,))
-            review_count = cursor.fetchone()[0]
-            
-            # 已掌握数量（mastered = 1）
-            cursor.execute('SELECT COUNT(*) FROM words WHERE mastered = 1')
-            mastered_count = cursor.fetchone()[0]
-            
-            # 总掌握数（mastered=1 或 next_review 的日期 > today）
-            cursor.execute('''
-                SELECT COUNT(*) FROM words 
-                WHERE mastered = 1 OR (next_review IS NOT NULL AND SUBSTR(next_review, 1, 10) > ?)
-            ''', (today,))
-            total_mastered = cursor.fetchone()[0]
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(review_count = 0), 0),
+                    COALESCE(SUM(mastered = 0 AND (next_review IS NULL OR next_review < ?)), 0),
+                    COALESCE(SUM(mastered = 1), 0),
+                    COALESCE(SUM(mastered = 1 OR (next_review IS NOT NULL AND next_review >= ?)), 0)
+                FROM words
+            ''', (tomorrow, tomorrow))
+            total, new_count, review_count, mastered_count, total_mastered = cursor.fetchone()
             
             return {
                 'total': total,
@@ -345,90 +882,46 @@ class DatabaseManager:
                 'total_mastered': total_mastered
             }
     
-    def migrate_from_json(self, json_data: Dict) -> None:
-        """从 JSON 数据迁移到数据库"""
-        if not json_data or 'words' not in json_data:
-            return
-        
-        words = json_data.get('words', [])
-        if not words:
-            return
+    def is_migrated_from_json(self) -> bool:
+        """是否已完成旧版 JSON 数据迁移（完成后启动时不再检查 JSON 文件）"""
+        with self._db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT value FROM app_state WHERE key = 'migrated_from_json'")
+            row = cursor.fetchone()
+            return row is not None and row['value'] == '1'
+    
+    def _mark_migrated_from_json(self, cursor: sqlite3.Cursor) -> None:
+        """记录 JSON 迁移已完成（与迁移数据在同一事务中提交）"""
+        cursor.execute('''
+            INSERT OR REPLACE INTO app_state (key, value) 
+            VALUES ('migrated_from_json', '1')
+        ''')
+    
+    def migrate_from_json_file(self, json_file) -> int:
+        """
+        从旧版 JSON 文件流式迁移到数据库（逐个解析单词，不在内存中构造整个文档）
         
+        Returns:
+            int: 写入的单词数量
+        """
+        now = int(datetime.now().timestamp())
+        extras: Dict = {}
         with self._db_connection() as conn:
             cursor = conn.cursor()
-            now = datetime.now().isoformat()
-            for word_data in words:
-                # 处理日期格式
-                next_review = word_data.get('next_review')
-                if isinstance(next_review, str):
-                    try:
-                        datetime.fromisoformat(next_review)
-                    except ValueError:
-                        next_review = now
-                elif isinstance(next_review, datetime):
-                    next_review = next_review.isoformat()
-                else:
-                    next_review = now
-                
-                last_review = word_data.get('last_review')
-                if isinstance(last_review, str):
-                    try:
-                        datetime.fromisoformat(last_review)
-                    except ValueError:
-                        last_review = None
-                elif isinstance(last_review, datetime):
-                    last_review = last_review.isoformat()
-                else:
-                    last_review = None
-                
-                cursor.execute('''
-                    INSERT OR REPLACE INTO words 
-                    (word, meaning, review_count, ease_factor, interval_days, 
-                     next_review, mastered, last_review, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    word_data.get('word', ''),
-                    word_data.get('meaning', ''),
-                    word_data.get('review_count', 0),
-                    word_data.get('ease_factor', 2.5),
-                    word_data.get('interval', 1),
-                    next_review,
-                    1 if word_data.get('mastered', False) else 0,
-                    last_review,
-                    now,
-                    now
-                ))
+            cursor.executemany(MIGRATE_WORD_SQL, (
+                _migrate_row(word_data, now)
+                for word_data in iter_json_array(json_file, 'words', extras)
+            ))
+            migrated = cursor.rowcount
             
-            # 迁移当前索引
-            current_index = json_data.get('current_index', 0)
+            # 迁移当前索引（文件遍历结束后 extras 中才有顶层的其他字段）
+            current_index = extras.get('current_index', 0)
             cursor.execute('''
                 INSERT OR REPLACE INTO app_state (key, value) 
                 VALUES ('current_index', ?)
             ''', (str(current_index),))
+            self._mark_migrated_from_json(cursor)
             
             conn.commit()
-            logger.info(f"成功迁移 {len(words)} 个单词到数据库")
-    
-    def _row_to_dict(self, row: Optional[sqlite3.Row]) -> Optional[Dict]:
-        """将数据库行转换为字典"""
-        if row is None:
-            return None
-        
-        result: Dict = {}
-        for key in row.keys():
-            value = row[key]
-            # 转换 mastered 和 review_count
-            if key == 'mastered':
-                result['mastered'] = bool(value)
-            elif key == 'interval_days':
-                result['interval'] = value
-            elif key == 'id':
-                result['id'] = value
-            else:
-                result[key] = value
-        
-        # 确保字段名与原有格式一致
-        if 'interval_days' in result:
-            result['interval'] = result.pop('interval_days')
-        
-        return result
+            logger.info(f"成功迁移 {migrated} 个单词到数据库")
+            return migrated
@@ -8,6 +8,44 @@ from pathlib import Path
 from db_manager import DatabaseManager
 
 
+def iter_csv_words(reader, counts):
+    """
+    逐行解析 CSV，产出待导入的 (word, meaning)
+    
+    去重（包括与数据库已有单词、文件内重复，均不区分大小写）由数据库的
+    idx_word_nocase 唯一索引完成，这里不再维护已存在单词集合。
+    
+    Args:
+        reader: csv.reader（已跳过标题行）
+        counts: 计数字典，更新 'fed'（产出数量）
+    """
+    fed = 0
+    quotes = '"\''
+    try:
+        for row in reader:
+            if len(row) < 2:
+                continue
+            
+            word = row[0].strip().strip(quotes)  # 去除引号
+            meaning = row[1].strip().strip(quotes)  # 去除引号
+            
+            # 跳过空行或标题行
+            if not word or not meaning:
+                continue
+            
+            # 跳过标题行（只检查第一行数据，如果第一列是"word"）
+            if fed == 0 and reader.line_num == 2 and word.lower() == 'word':
+                continue
+            
+            fed += 1
+            if not fed % 5000:
+                print(f"已读取 {fed} 个单词...")
+            yield word, meaning
+    finally:
+        # 计数只在结束时写回，循环内只更新局部变量
+        counts['fed'] = fed
+
+
 def import_csv_to_database(csv_file_path, db_manager):
     """
     从CSV文件导入单词到数据库
@@ -27,23 +65,17 @@ def import_csv_to_database(csv_file_path, db_manager):
     
     print(f"正在读取CSV文件: {csv_path}")
     
-    # 获取数据库中已有的单词（用于去重）
-    existing_words = set()
-    all_words = db_manager.get_all_words()
-    for word_data in all_words:
-        existing_words.add(word_data['word'].lower().strip())
-    
-    print(f"数据库中已有 {len(existing_words)} 个单词")
+    print(f"数据库中已有 {db_manager.get_word_count()} 个单词")
     
     imported_count = 0
     skipped_count = 0
     error_count = 0
     
-    # 收集要导入的单词（用于批量插入）
-    words_to_import = []
+    # 读取计数（生成器在解析过程中更新）
+    counts = {'fed': 0}
     
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
+        with db_manager.bulk_load_context(), open(csv_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
             # 尝试检测分隔符
             sample = f.read(1024)
             f.seek(0)
@@ -55,6 +87,7 @@ def import_csv_to_database(csv_file_path, db_manager):
             elif '\t' in sample:
                 delimiter = '\t'
             
+            # csv.reader 由 C 实现（_csv），按行流式解析，不需要把整个文件读入内存
             reader = csv.reader(f, delimiter=delimiter)
             
             # 跳过标题行
@@ -62,50 +95,20 @@ def import_csv_to_database(csv_file_path, db_manager):
             if header:
                 print(f"检测到标题行: {header}")
             
-            for row_num, row in enumerate(reader, 2):  # 从第2行开始计数
-                if len(row) < 2:
-                    continue
-                
-                word = row[0].strip().strip('"\'')  # 去除引号
-                meaning = row[1].strip().strip('"\'')  # 去除引号
-                
-                # 跳过空行或标题行
-                if not word or not meaning:
-                    continue
-                
-                # 跳过标题行（如果第一列是"word"）
-                if word.lower() == 'word' and row_num == 2:
-                    continue
-                
-                # 去重：检查单词是否已存在（不区分大小写）
-                if word.lower() in existing_words:
-                    skipped_count += 1
-                    continue
-                
-                # 添加到待导入列表
-                words_to_import.append((word, meaning))
-                existing_words.add(word.lower())  # 添加到已存在集合（避免同一批次重复）
-                
-                # 每1000个单词批量插入一次
-                if len(words_to_import) >= 1000:
-                    added = db_manager.batch_add_words(words_to_import)
-                    imported_count += added
-                    skipped_count += (len(words_to_import) - added)
-                    words_to_import = []
-                    
-                    if imported_count % 5000 == 0:
-                        print(f"已导入 {imported_count} 个单词，跳过 {skipped_count} 个重复单词...")
-            
-            # 导入剩余的单词
-            if words_to_import:
-                added = db_manager.batch_add_words(words_to_import)
-                imported_count += added
-                skipped_count += (len(words_to_import) - added)
+            # 边解析边插入，不保留待导入列表
+            imported_count = db_manager.bulk_insert_iter(
+                iter_csv_words(reader, counts)
+            )
+            # 被唯一索引忽略的即为重复单词
+            skipped_count = counts['fed'] - imported_count
     
     except Exception as e:
         print(f"读取CSV文件失败: {e}")
         import traceback
         traceback.print_exc()
+        # 出错前已提交的部分仍在数据库中，按已提交的计数报告
+        imported_count = getattr(e, 'added', imported_count)
+        skipped_count = getattr(e, 'processed', imported_count) - imported_count
         return (imported_count, skipped_count, error_count)
     
     return (imported_count, skipped_count, error_count)
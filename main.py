@@ -5,23 +5,30 @@
 """
 import sys
 import logging
-from PyQt5.QtWidgets import QApplication
-from app_paths import get_app_data_dir
-from main_window import MainWindow
 
-# 配置日志（打包后写入固定数据目录）
-_log_dir = get_app_data_dir()
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(_log_dir / 'word_card_app.log', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+
+def setup_logging():
+    """配置日志（打包后写入固定数据目录）"""
+    from app_paths import get_app_data_dir
+    
+    log_dir = get_app_data_dir()
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_dir / 'word_card_app.log', encoding='utf-8'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
 
 
 def main():
+    # PyQt5 和主窗口只在真正启动界面时导入，import main 不会加载 Qt，也不会创建数据目录
+    from PyQt5.QtWidgets import QApplication
+    from main_window import MainWindow
+    
+    setup_logging()
+    
     app = QApplication(sys.argv)
     app.setApplicationName("单词卡片")
     
@@ -34,7 +41,7 @@ def main():
         QGroupBox::title { color: #2d2d2d; }
         QPushButton { color: #2d2d2d; font-size: 13px; }
         QLineEdit { color: #2d2d2d; font-size: 14px; background-color: #e2e0da; }
-        QListWidget { color: #2d2d2d; font-size: 13px; background-color: #e2e0da; }
+        QListView { color: #2d2d2d; font-size: 13px; background-color: #e2e0da; }
         QTextEdit { color: #2d2d2d; font-size: 13px; background-color: #e2e0da; }
         QProgressBar { color: #2d2d2d; }
     """)
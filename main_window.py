@@ -1,24 +1,39 @@
 """
 主窗口 - 单词卡片应用界面
 """
+from collections import OrderedDict
+from functools import lru_cache
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLabel, QListWidget, QListWidgetItem, QMessageBox,
+    QLabel, QListView, QMessageBox,
     QFileDialog, QSplitter, QGroupBox,
-    QDialog, QLineEdit, QDialogButtonBox, QApplication, QSizePolicy
+    QDialog, QLineEdit, QDialogButtonBox, QSizePolicy
 )
-from PyQt5.QtCore import Qt, QTimer, QRectF
-from PyQt5.QtGui import QFont, QColor, QPainter, QPen, QBrush
+from PyQt5.QtCore import (
+    Qt, QTimer, QRectF, QThread, pyqtSignal, QAbstractListModel, QModelIndex
+)
+from PyQt5.QtGui import QFont, QColor, QPainter, QPainterPath, QPen, QBrush, QImage
 from word_card import WordCard
 from word_manager import WordManager
-from db_manager import DatabaseManager
-from data_manager import DataManager
-from datetime import datetime, timedelta
+from db_manager import DatabaseManager, day_start_timestamp, nocase_key
+from data_manager import DataManager, iter_json_array
 
 
 # 饼图已掌握颜色（与图例一致）
 PIE_MASTERED_COLOR = QColor(78, 205, 196)
 
+# 单词列表前缀：按 SQL 返回的标记码直接取用
+# 1 = 需要复习（红色），2 = 已掌握或暂不需复习（绿色）
+PREFIX_REVIEW = '🔴 '
+PREFIX_MASTERED = '✅ '
+WORD_MARKERS = ('', PREFIX_REVIEW, PREFIX_MASTERED)
+
+# 导入单词文件时的读缓冲大小
+IMPORT_READ_BUFFER = 1 << 20
+# 后台导入时每个事务提交的单词数（每次提交后更新一次进度）
+IMPORT_COMMIT_ROWS = 5000
+WORD_LIST_BATCH_SIZE = 256  # 单词列表分批布局时每批的行数
+
 # 布局常量（统一边距与间距）
 LAYOUT_MARGIN = 16
 LAYOUT_SPACING = 12
@@ -28,9 +43,277 @@ LEFT_PANEL_MIN_WIDTH = 220
 CARD_PANEL_MIN_WIDTH = 420
 STATS_PANEL_MIN_WIDTH = 200
 
+@lru_cache(maxsize=None)
+def app_font(point_size, weight=QFont.Normal):
+    """
+    返回界面使用的 Arial 字体（按字号、字重缓存）
+    
+    首次使用时才创建（此时 QApplication 已存在），之后重绘和构建控件都复用同一对象；
+    setFont 会复制字体，共享不会互相影响。
+    """
+    return QFont('Arial', point_size, weight)
+
+
+# 样式表常量（模块加载时创建一次，各对话框、按钮共用）
+WORD_INPUT_QSS = """
+    QLineEdit {
+        padding: 8px;
+        border: 2px solid #ddd;
+        border-radius: 5px;
+        font-size: 14px;
+        color: #2d2d2d;
+        background-color: #e2e0da;
+    }
+    QLineEdit:focus {
+        border: 2px solid #4ecdc4;
+    }
+"""
+MEANING_INPUT_QSS = """
+    QLineEdit {
+        padding: 8px;
+        border: 2px solid #ccc;
+        border-radius: 5px;
+        font-size: 14px;
+        color: #2d2d2d;
+        background-color: #e2e0da;
+    }
+    QLineEdit:focus {
+        border: 2px solid #4ecdc4;
+    }
+"""
+NAV_BTN_QSS = """
+    QPushButton {
+        background-color: #c0c4c0;
+        color: #2d2d2d;
+        border: 1px solid #a8aca8;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #b4b8b4;
+        border-color: #4ecdc4;
+        color: #1a1a1a;
+    }
+    QPushButton:pressed { background-color: #a8aca8; color: #1a1a1a; }
+    QPushButton:disabled { color: #7a7a7a; background-color: #c8ccc8; }
+"""
+WORD_LIST_QSS = """
+    QListView::item:selected { background-color: #c8dcff; color: #2d2d2d; }
+"""
+FORGOT_BTN_QSS = """
+    QPushButton {
+        background-color: #ff6b6b;
+        color: #fff;
+        font-weight: bold;
+        font-size: 18px;
+        padding: 16px 24px;
+        border: none;
+        border-radius: 8px;
+    }
+    QPushButton:hover { background-color: #ff5252; }
+    QPushButton:pressed { background-color: #e04545; }
+"""
+MASTERED_BTN_QSS = """
+    QPushButton {
+        background-color: #4ecdc4;
+        color: #fff;
+        font-weight: bold;
+        font-size: 18px;
+        padding: 16px 24px;
+        border: none;
+        border-radius: 8px;
+    }
+    QPushButton:hover { background-color: #45b7aa; }
+    QPushButton:pressed { background-color: #3da99e; }
+"""
+
+
+class WordListModel(QAbstractListModel):
+    """
+    单词列表模型：按页从数据库读取显示文本，只缓存最近访问的几页
+    
+    视图只请求可见行，因此单词再多也只会查询、保留屏幕附近的数据。
+    """
+    PAGE_SIZE = 64
+    MAX_PAGES = 4  # 最多缓存 256 行
+    
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self._count = 0
+        self._tomorrow = day_start_timestamp(1)
+        self._pages = OrderedDict()  # 页号 -> 该页各行的显示文本（LRU 顺序）
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._count
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        page_no, offset = divmod(index.row(), self.PAGE_SIZE)
+        page = self._pages.get(page_no)
+        if page is None:
+            page = self._load_page(page_no)
+        else:
+            self._pages.move_to_end(page_no)
+        return page[offset] if offset < len(page) else None
+    
+    def _load_page(self, page_no):
+        """从数据库读取一页，超出缓存上限时淘汰最久未使用的页"""
+        markers = WORD_MARKERS
+        rows = self.db_manager.get_word_display_page(
+            page_no * self.PAGE_SIZE, self.PAGE_SIZE, self._tomorrow
+        )
+        page = [markers[marker] + word for word, marker in rows]
+        self._pages[page_no] = page
+        if len(self._pages) > self.MAX_PAGES:
+            self._pages.popitem(last=False)
+        return page
+    
+    def refresh(self, count, tomorrow):
+        """
+        数据变化后刷新，尽量不重置模型（重置会丢失滚动位置并让视图重新布局）：
+        - 行数不变（评分、编辑）：只通知视图重新读取可见行
+        - 行数增加（添加、导入）：新单词 id 递增，按追加到末尾插入行
+        - 其他情况（清空等）：重置模型
+        
+        Args:
+            count: 当前单词总数
+            tomorrow: 本地明天零点的时间戳
+        """
+        self._tomorrow = tomorrow
+        self._pages.clear()
+        old_count = self._count
+        if 0 < old_count <= count:
+            if count > old_count:
+                self.beginInsertRows(QModelIndex(), old_count, count - 1)
+                self._count = count
+                self.endInsertRows()
+            self.dataChanged.emit(self.index(0), self.index(old_count - 1), [Qt.DisplayRole])
+            return
+        self.beginResetModel()
+        self._count = count
+        self.endResetModel()
+    
+    def refresh_row(self, row, word_data=None):
+        """
+        单个单词数据变化后（如评分）只刷新这一行
+        
+        传入 word_data（单词缓存中已更新的这一项）且该行所在页已缓存时，直接按它更新这一行，
+        不重新查询数据库，也不必等待后台写线程提交；否则丢弃该页，下次显示时重新读取。
+        """
+        if not 0 <= row < self._count:
+            return
+        page_no, offset = divmod(row, self.PAGE_SIZE)
+        page = self._pages.get(page_no)
+        if word_data is not None and page is not None and offset < len(page):
+            next_review = word_data['next_review']
+            due = not word_data['mastered'] and (next_review is None or next_review < self._tomorrow)
+            page[offset] = WORD_MARKERS[1 if due else 2] + word_data['word']
+        else:
+            self._pages.pop(page_no, None)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+    
+    def remove_row(self, row):
+        """删除一行（数据库中的单词已删除后调用），其余行保持不动"""
+        if not 0 <= row < self._count:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._count -= 1
+        self._pages.clear()
+        self.endRemoveRows()
+
+
+class JsonProbeThread(QThread):
+    """后台流式统计旧版 JSON 数据文件中的单词数，避免大文件解析阻塞界面"""
+    loaded = pyqtSignal(int)  # 单词数量，文件不存在或解析失败时为 0
+    
+    def __init__(self, data_manager, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+    
+    def run(self):
+        self.loaded.emit(self.data_manager.count_words())
+
+
+def _iter_import_items(file_path):
+    """逐个产出导入文件中的 (单词, 释义)（未去除空格，可能为空）"""
+    if file_path.endswith('.json'):
+        # 流式解析 "words" 数组，逐个解码元素，不构造整个文档
+        for word_data in iter_json_array(file_path, 'words'):
+            if 'word' in word_data and 'meaning' in word_data:
+                yield word_data['word'], word_data['meaning']
+    else:
+        # 文本格式：每行 "单词|释义" 或 "单词 释义"
+        # 按行流式读取，1 MiB 读缓冲减少逐行迭代时的读文件次数
+        with open(file_path, 'r', encoding='utf-8', buffering=IMPORT_READ_BUFFER) as f:
+            for line in f:
+                word, sep, meaning = line.partition('|')
+                if not sep:
+                    parts = line.split(None, 1)
+                    if len(parts) < 2:
+                        continue
+                    word, meaning = parts
+                yield word, meaning
+
+
+def iter_import_file(file_path, counts):
+    """
+    逐个产出导入文件中非空的 (单词, 释义)（JSON 或文本），供 bulk_insert_iter 流式写入
+    
+    Args:
+        file_path: 导入文件路径
+        counts: 计数字典，更新 'fed'（产出数量）
+    """
+    fed = 0
+    try:
+        for word, meaning in _iter_import_items(file_path):
+            word = word.strip()
+            meaning = meaning.strip()
+            if word and meaning:
+                fed += 1
+                yield word, meaning
+    finally:
+        counts['fed'] = fed
+
+
+class ImportWordsThread(QThread):
+    """后台解析导入文件并批量写入数据库，避免大文件导入阻塞界面"""
+    progress = pyqtSignal(int)  # 已处理的单词数
+    done = pyqtSignal(int, int)  # 成功导入数, 跳过的重复单词数
+    failed = pyqtSignal(str)  # 错误信息
+    
+    def __init__(self, db_manager, file_path, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.file_path = file_path
+    
+    def run(self):
+        # 本线程使用自己的数据库连接，每次提交与后台写线程通过写事务互斥锁轮流进行；
+        # 已存在的单词（不区分大小写）和文件内的重复由 INSERT OR IGNORE 跳过
+        # 文件边解析边写入，内存占用与文件大小无关
+        counts = {'fed': 0}
+        try:
+            pairs = iter_import_file(self.file_path, counts)
+            count = self.db_manager.bulk_insert_iter(pairs, IMPORT_COMMIT_ROWS, self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        finally:
+            # 每次导入都是新线程，结束时关闭它的连接，避免连接随导入次数累积
+            self.db_manager.release_connection()
+        self.done.emit(count, counts['fed'] - count)
+
 
 class PieChartWidget(QWidget):
     """饼状图：显示新单词、待复习、已掌握比例，中心为已掌握占总数的比例"""
+    
+    # 为 True 时扇形的 1px 描边也开启抗锯齿（描边很细，关闭后几乎看不出差别）
+    HIGH_QUALITY = False
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(180, 180)
@@ -39,18 +322,52 @@ class PieChartWidget(QWidget):
         self._new_count = 0
         self._review_count = 0
         self._mastered_count = 0
+        # 渲染结果缓存：尺寸和数据不变时重绘只需贴图，不再重新光栅化扇形
+        self._cache_image = None
+        self._cache_key = None
     
     def set_data(self, total, new_count, review_count, mastered_count):
-        self._total = total
-        self._new_count = new_count
-        self._review_count = review_count
-        self._mastered_count = mastered_count
+        data = (total, new_count, review_count, mastered_count)
+        if data == (self._total, self._new_count, self._review_count, self._mastered_count):
+            return
+        self._total, self._new_count, self._review_count, self._mastered_count = data
         self.update()
     
+    def resizeEvent(self, event):
+        # 尺寸变化后旧缓存不再可用，释放掉，下次绘制时按新尺寸重建
+        self._cache_image = None
+        self._cache_key = None
+        super().resizeEvent(event)
+    
     def paintEvent(self, event):
+        # 需要重绘的区域与饼图无交集时（例如只有相邻控件失效）直接跳过
+        region = event.region()
+        if not region.intersects(self.rect()):
+            return
+        
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr,
+               self._total, self._new_count, self._review_count, self._mastered_count)
+        if key != self._cache_key:
+            # 按设备像素比分配，HiDPI 屏幕上缓存图同样清晰；
+            # 预乘 ARGB32 与 Qt 光栅引擎的内部格式一致，绘制和贴图时都无需格式转换
+            image = QImage(round(self.width() * dpr), round(self.height() * dpr),
+                           QImage.Format_ARGB32_Premultiplied)
+            image.setDevicePixelRatio(dpr)
+            image.fill(Qt.transparent)
+            cache_painter = QPainter(image)
+            self._render(cache_painter)
+            cache_painter.end()
+            self._cache_image = image
+            self._cache_key = key
+        
         painter = QPainter(self)
+        painter.setClipRegion(region)
+        painter.drawImage(0, 0, self._cache_image)
+    
+    def _render(self, painter):
+        """绘制饼图（绘制到缓存 QImage 上）"""
         painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
         
         w, h = self.width(), self.height()
         side = min(w, h) - 10
@@ -71,30 +388,49 @@ class PieChartWidget(QWidget):
         mastered_span = int((self._mastered_count / total) * 360 * 16)
         rest_angle = 360 * 16 - mastered_span
         start_angle = 90 * 16
+        wedges = []
         # 待学习（中性灰）
         if rest_angle > 0:
-            painter.setBrush(QBrush(QColor(200, 200, 200)))
-            painter.setPen(QPen(QColor(220, 220, 220), 1))
-            painter.drawPie(rect, start_angle, rest_angle)
+            wedges.append((QColor(200, 200, 200), start_angle, rest_angle))
             start_angle += rest_angle
         # 已掌握（绿色）
         if mastered_span > 0:
-            painter.setBrush(QBrush(PIE_MASTERED_COLOR))
-            painter.setPen(QPen(QColor(220, 220, 220), 1))
-            painter.drawPie(rect, start_angle, mastered_span)
+            wedges.append((PIE_MASTERED_COLOR, start_angle, mastered_span))
         
-        # 中心：已掌握比例 = 已掌握数 / 总单词数（与扇形一致）
+        # 中心圆区域
         cx, cy = rect.center().x(), rect.center().y()
         inner_r = side * 0.42
         inner_rect = QRectF(cx - inner_r, cy - inner_r, inner_r * 2, inner_r * 2)
+        
+        # 每个扇区直接构造成环形路径（外弧 + 反向内弧），中心部分不会被扇形和圆重复填充
+        paths = []
+        for color, start, span in wedges:
+            path = QPainterPath()
+            path.arcMoveTo(rect, start / 16)
+            path.arcTo(rect, start / 16, span / 16)
+            path.arcTo(inner_rect, (start + span) / 16, -span / 16)
+            path.closeSubpath()
+            paths.append((color, path))
+        
+        # 扇区填充（弧线需要抗锯齿）
+        for color, path in paths:
+            painter.fillPath(path, QBrush(color))
+        # 1px 描边单独绘制，默认不开抗锯齿
+        painter.setRenderHint(QPainter.Antialiasing, self.HIGH_QUALITY)
+        painter.setBrush(Qt.NoBrush)
+        painter.setPen(QPen(QColor(220, 220, 220), 1))
+        for _, path in paths:
+            painter.drawPath(path)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        
+        # 中心：已掌握比例 = 已掌握数 / 总单词数（与扇形一致）
         painter.setBrush(QBrush(QColor(0xe2, 0xe0, 0xda)))
         painter.setPen(QPen(QColor(180, 180, 180), 2))
         painter.drawEllipse(inner_rect)
         mastered_pct = round((self._mastered_count / total) * 100)
         mastered_pct = min(100, max(0, mastered_pct))
         painter.setPen(QColor(45, 45, 45))
-        font = QFont('Arial', 13, QFont.Bold)
-        painter.setFont(font)
+        painter.setFont(app_font(13, QFont.Bold))
         painter.drawText(inner_rect, Qt.AlignCenter, f'{mastered_pct}%\n已掌握')
 
 
@@ -113,48 +449,24 @@ class AddWordDialog(QDialog):
         
         # 单词输入
         word_label = QLabel('单词:')
-        word_label.setFont(QFont('Arial', 11))
+        word_label.setFont(app_font(11))
         layout.addWidget(word_label)
         
         self.word_input = QLineEdit()
         self.word_input.setPlaceholderText('请输入单词')
-        self.word_input.setFont(QFont('Arial', 12))
-        self.word_input.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                font-size: 14px;
-                color: #2d2d2d;
-                background-color: #e2e0da;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4ecdc4;
-            }
-        """)
+        self.word_input.setFont(app_font(12))
+        self.word_input.setStyleSheet(WORD_INPUT_QSS)
         layout.addWidget(self.word_input)
         
         # 释义输入
         meaning_label = QLabel('释义:')
-        meaning_label.setFont(QFont('Arial', 11))
+        meaning_label.setFont(app_font(11))
         layout.addWidget(meaning_label)
         
         self.meaning_input = QLineEdit()
         self.meaning_input.setPlaceholderText('请输入释义')
-        self.meaning_input.setFont(QFont('Arial', 12))
-        self.meaning_input.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #ccc;
-                border-radius: 5px;
-                font-size: 14px;
-                color: #2d2d2d;
-                background-color: #e2e0da;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4ecdc4;
-            }
-        """)
+        self.meaning_input.setFont(app_font(12))
+        self.meaning_input.setStyleSheet(MEANING_INPUT_QSS)
         layout.addWidget(self.meaning_input)
         
         # 按钮
@@ -194,48 +506,24 @@ class EditWordDialog(QDialog):
         
         # 单词输入
         word_label = QLabel('单词:')
-        word_label.setFont(QFont('Arial', 11))
+        word_label.setFont(app_font(11))
         layout.addWidget(word_label)
         
         self.word_input = QLineEdit()
         self.word_input.setText(word)
-        self.word_input.setFont(QFont('Arial', 12))
-        self.word_input.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                font-size: 14px;
-                color: #2d2d2d;
-                background-color: #e2e0da;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4ecdc4;
-            }
-        """)
+        self.word_input.setFont(app_font(12))
+        self.word_input.setStyleSheet(WORD_INPUT_QSS)
         layout.addWidget(self.word_input)
         
         # 释义输入
         meaning_label = QLabel('释义:')
-        meaning_label.setFont(QFont('Arial', 11))
+        meaning_label.setFont(app_font(11))
         layout.addWidget(meaning_label)
         
         self.meaning_input = QLineEdit()
         self.meaning_input.setText(meaning)
-        self.meaning_input.setFont(QFont('Arial', 12))
-        self.meaning_input.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #ccc;
-                border-radius: 5px;
-                font-size: 14px;
-                color: #2d2d2d;
-                background-color: #e2e0da;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4ecdc4;
-            }
-        """)
+        self.meaning_input.setFont(app_font(12))
+        self.meaning_input.setStyleSheet(MEANING_INPUT_QSS)
         layout.addWidget(self.meaning_input)
         
         # 按钮
@@ -262,11 +550,34 @@ class EditWordDialog(QDialog):
 
 
 class MainWindow(QMainWindow):
+    # 后台写线程中写入失败（在写线程中发出，排队到界面线程处理）
+    write_failed = pyqtSignal(str)
+    
     def __init__(self):
         super().__init__()
         self.db_manager = DatabaseManager()
+        self.write_failed.connect(self.on_write_failed)
+        self.db_manager.on_write_error = lambda error: self.write_failed.emit(str(error))
+        self._write_error_open = False  # 写入失败提示框是否正在显示
         self.word_manager = WordManager(self.db_manager)
         self.data_manager = DataManager()  # 保留用于迁移
+        
+        # 刷新合并：同一轮事件循环内多次请求刷新只执行一次
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_update_display)
+        
+        # 统计缓存：只有单词数据变化（或跨过零点）后才重新查询数据库
+        self._stats_cache = None
+        self._stats_dirty = True
+        self._stats_day = None
+        
+        # 后台读取旧版 JSON 的线程（仅在需要迁移检查时创建）
+        self._json_probe = None
+        # 后台导入线程（导入进行中时不允许再次导入）
+        self._import_thread = None
+        
         self.init_ui()
         
         # 延迟加载数据，先显示界面
@@ -320,14 +631,24 @@ class MainWindow(QMainWindow):
         
         # 标题（与右侧统计标题字号一致）
         title = QLabel('单词库')
-        title.setFont(QFont('Arial', PANEL_TITLE_FONT_SIZE, QFont.Bold))
+        title.setFont(app_font(PANEL_TITLE_FONT_SIZE, QFont.Bold))
         layout.addWidget(title)
         
         # 单词列表
-        self.word_list = QListWidget()
+        # 列表数据由 WordListModel 按需分页读取；行高统一，视图无需逐行计算尺寸
+        self.word_model = WordListModel(self.db_manager, self)
+        self.word_list = QListView()
+        self.word_list.setModel(self.word_model)
+        self.word_list.setUniformItemSizes(True)
+        # 大量行一次性出现（首次加载、导入后）时分批布局，避免一次布局全部行阻塞界面
+        self.word_list.setLayoutMode(QListView.Batched)
+        self.word_list.setBatchSize(WORD_LIST_BATCH_SIZE)
+        self.word_list.setEditTriggers(QListView.NoEditTriggers)
         self.word_list.setMinimumHeight(200)
-        self.word_list.itemClicked.connect(self.on_word_selected)
-        self.word_list.itemDoubleClicked.connect(self.on_word_double_clicked)
+        self.word_list.clicked.connect(self.on_word_selected)
+        self.word_list.doubleClicked.connect(self.on_word_double_clicked)
+        # 当前单词通过 setCurrentIndex 选中，选中样式统一在这里设置一次
+        self.word_list.setStyleSheet(WORD_LIST_QSS)
         layout.addWidget(self.word_list)
         
         # 操作按钮组（统一间距）
@@ -340,9 +661,9 @@ class MainWindow(QMainWindow):
         btn_add.clicked.connect(self.add_word)
         btn_layout.addWidget(btn_add)
         
-        btn_import = QPushButton('📥 导入单词')
-        btn_import.clicked.connect(self.import_words)
-        btn_layout.addWidget(btn_import)
+        self.btn_import = QPushButton('📥 导入单词')
+        self.btn_import.clicked.connect(self.import_words)
+        btn_layout.addWidget(self.btn_import)
         
         btn_delete = QPushButton('🗑️ 删除单词')
         btn_delete.clicked.connect(self.delete_word)
@@ -366,7 +687,7 @@ class MainWindow(QMainWindow):
         
         # 标题
         title = QLabel('单词卡片')
-        title.setFont(QFont('Arial', CARD_TITLE_FONT_SIZE, QFont.Bold))
+        title.setFont(app_font(CARD_TITLE_FONT_SIZE, QFont.Bold))
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
@@ -381,48 +702,14 @@ class MainWindow(QMainWindow):
         
         btn_prev = QPushButton('◀ 上一个')
         btn_prev.setMinimumWidth(110)
-        btn_prev.setStyleSheet("""
-            QPushButton {
-                background-color: #c0c4c0;
-                color: #2d2d2d;
-                border: 1px solid #a8aca8;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #b4b8b4;
-                border-color: #4ecdc4;
-                color: #1a1a1a;
-            }
-            QPushButton:pressed { background-color: #a8aca8; color: #1a1a1a; }
-            QPushButton:disabled { color: #7a7a7a; background-color: #c8ccc8; }
-        """)
+        btn_prev.setStyleSheet(NAV_BTN_QSS)
         btn_prev.clicked.connect(self.prev_word)
         btn_layout.addWidget(btn_prev)
         btn_layout.addSpacing(LAYOUT_MARGIN)
         
         btn_next = QPushButton('下一个 ▶')
         btn_next.setMinimumWidth(110)
-        btn_next.setStyleSheet("""
-            QPushButton {
-                background-color: #c0c4c0;
-                color: #2d2d2d;
-                border: 1px solid #a8aca8;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #b4b8b4;
-                border-color: #4ecdc4;
-                color: #1a1a1a;
-            }
-            QPushButton:pressed { background-color: #a8aca8; color: #1a1a1a; }
-            QPushButton:disabled { color: #7a7a7a; background-color: #c8ccc8; }
-        """)
+        btn_next.setStyleSheet(NAV_BTN_QSS)
         btn_next.clicked.connect(self.next_word)
         btn_layout.addWidget(btn_next)
         
@@ -439,19 +726,7 @@ class MainWindow(QMainWindow):
         btn_forgot = QPushButton('❌ 忘记')
         btn_forgot.setMinimumWidth(180)
         btn_forgot.setMinimumHeight(60)
-        btn_forgot.setStyleSheet("""
-            QPushButton {
-                background-color: #ff6b6b;
-                color: #fff;
-                font-weight: bold;
-                font-size: 18px;
-                padding: 16px 24px;
-                border: none;
-                border-radius: 8px;
-            }
-            QPushButton:hover { background-color: #ff5252; }
-            QPushButton:pressed { background-color: #e04545; }
-        """)
+        btn_forgot.setStyleSheet(FORGOT_BTN_QSS)
         btn_forgot.clicked.connect(self.rate_word_forgot)
         feedback_layout.addWidget(btn_forgot)
         feedback_layout.addSpacing(LAYOUT_MARGIN)
@@ -459,19 +734,7 @@ class MainWindow(QMainWindow):
         btn_mastered = QPushButton('✅ 掌握')
         btn_mastered.setMinimumWidth(180)
         btn_mastered.setMinimumHeight(60)
-        btn_mastered.setStyleSheet("""
-            QPushButton {
-                background-color: #4ecdc4;
-                color: #fff;
-                font-weight: bold;
-                font-size: 18px;
-                padding: 16px 24px;
-                border: none;
-                border-radius: 8px;
-            }
-            QPushButton:hover { background-color: #45b7aa; }
-            QPushButton:pressed { background-color: #3da99e; }
-        """)
+        btn_mastered.setStyleSheet(MASTERED_BTN_QSS)
         btn_mastered.clicked.connect(self.rate_word_mastered)
         btn_mastered.setEnabled(True)
         feedback_layout.addWidget(btn_mastered)
@@ -490,12 +753,12 @@ class MainWindow(QMainWindow):
         
         # 标题（与左侧标题字号一致）
         title = QLabel('学习统计')
-        title.setFont(QFont('Arial', PANEL_TITLE_FONT_SIZE, QFont.Bold))
+        title.setFont(app_font(PANEL_TITLE_FONT_SIZE, QFont.Bold))
         layout.addWidget(title)
         
         # 总单词数
         self.label_total_words = QLabel('共 0 个单词')
-        self.label_total_words.setFont(QFont('Arial', 12, QFont.Bold))
+        self.label_total_words.setFont(app_font(12, QFont.Bold))
         layout.addWidget(self.label_total_words)
         
         # 饼状图（固定比例，避免被拉得过扁）
@@ -517,117 +780,154 @@ class MainWindow(QMainWindow):
     def load_data_async(self):
         """异步加载数据（优化启动速度）"""
         self.statusBar().showMessage('正在加载数据...')
-        QApplication.processEvents()  # 刷新界面
         
         # 快速检查数据库是否有数据（只检查数量，不加载全部）
         word_count = self.db_manager.get_word_count()
         
-        # 如果数据库为空，尝试从 JSON 文件迁移
-        if word_count == 0:
-            json_data = self.data_manager.load()
-            if json_data and json_data.get('words'):
-                # 询问用户是否迁移
-                reply = QMessageBox.question(
-                    self, '数据迁移',
-                    f'检测到 JSON 文件中有 {len(json_data.get("words", []))} 个单词，\n'
-                    '是否要迁移到数据库？',
-                    QMessageBox.Yes | QMessageBox.No
-                )
-                if reply == QMessageBox.Yes:
-                    self.db_manager.migrate_from_json(json_data)
-                    self.word_manager._invalidate_cache()  # 清除缓存
-                    QMessageBox.information(self, '迁移成功', '数据已成功迁移到数据库！')
-        
-        # 从数据库加载当前索引
-        self.word_manager.current_index = self.db_manager.get_current_index()
-        
-        # 更新显示
+        # 如果数据库为空且尚未迁移过，在后台线程统计 JSON 文件中的单词数，完成后再询问是否迁移
+        if word_count == 0 and not self.db_manager.is_migrated_from_json():
+            self._json_probe = JsonProbeThread(self.data_manager, self)
+            self._json_probe.loaded.connect(self.on_json_probed)
+            self._json_probe.finished.connect(self._json_probe.deleteLater)
+            self._json_probe.start()
+        
+        # 更新显示（当前索引在首次访问时从数据库加载）
         self.update_display()
         self.statusBar().showMessage('就绪')
     
+    def on_json_probed(self, word_count):
+        """旧版 JSON 文件统计完成（在界面线程中执行）"""
+        self._json_probe = None
+        if not word_count:
+            return
+        
+        # 询问用户是否迁移
+        reply = QMessageBox.question(
+            self, '数据迁移',
+            f'检测到 JSON 文件中有 {word_count} 个单词，\n'
+            '是否要迁移到数据库？',
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply == QMessageBox.Yes:
+            # 先写入内存中的当前索引，迁移后以 JSON 中的索引为准（清除缓存后从数据库重新加载）
+            self.save_data()
+            # 流式迁移：逐个解析单词写入数据库，不在内存中构造整个文档
+            try:
+                self.db_manager.migrate_from_json_file(self.data_manager.data_file)
+            except Exception as e:
+                QMessageBox.critical(self, '迁移失败', f'迁移数据时出错: {str(e)}')
+                return
+            self.word_manager._invalidate_cache()  # 清除缓存
+            self._stats_dirty = True
+            self.update_display()
+            QMessageBox.information(self, '迁移成功', '数据已成功迁移到数据库！')
+    
+    def on_write_failed(self, message):
+        """
+        后台写入失败（写操作已回滚）：内存中的单词缓存、统计和列表可能已提前显示了新值，
+        全部从数据库重新加载，使界面与实际保存的数据一致
+        """
+        self.word_manager._invalidate_cache()
+        self._stats_dirty = True
+        self.update_display()
+        self.statusBar().showMessage('保存失败')
+        # 连续多次失败时只弹出一个提示框
+        if not self._write_error_open:
+            self._write_error_open = True
+            try:
+                QMessageBox.critical(self, '保存失败', f'写入数据库时出错，最近的修改未能保存: {message}')
+            finally:
+                self._write_error_open = False
+    
     def save_data(self):
-        """兼容接口：数据由数据库自动保存，当前索引在切换时已保存"""
-        pass
+        """保存数据：单词由数据库自动保存，这里只写入切换过的当前索引"""
+        self.word_manager.flush_index()
     
     def update_display(self):
+        """请求更新显示（在下一轮事件循环中执行，连续多次请求合并为一次）"""
+        self._refresh_timer.start()
+    
+    def _do_update_display(self):
         """更新显示"""
         # 获取单词列表（使用缓存，避免重复查询）
         words = self.word_manager.words
         
-        # 如果单词数量很大，使用批量更新优化性能
-        word_count = len(words)
-        if word_count > 1000:
-            # 大量单词时，先暂停更新以提高性能
-            self.word_list.setUpdatesEnabled(False)
+        # 刷新单词列表：模型按需分页读取，待复习标记在 SQL 中计算（按日期比较，忽略时间），
+        # 复习时间早于本地明天零点即为“今天或过去”
+        tomorrow = day_start_timestamp(1)
+        self.word_model.refresh(len(words), tomorrow)
         
-        # 更新单词列表
-        self.word_list.clear()
-        now = datetime.now()
+        # 更新统计
+        self._refresh_stats(tomorrow)
         
-        for i, word_data in enumerate(words):
-            word = word_data['word']
-            next_review = word_data.get('next_review')
-            
-            # 解析日期，如果解析失败或不存在，视为需要复习
-            if next_review:
-                try:
-                    next_review_dt = datetime.fromisoformat(next_review) if isinstance(next_review, str) else next_review
-                except (ValueError, TypeError):
-                    next_review_dt = datetime.now() - timedelta(days=1)
-            else:
-                next_review_dt = datetime.now() - timedelta(days=1)
-            
-            # 显示待复习标记
-            # 只比较日期部分（忽略时间）
-            next_review_date = next_review_dt.date()
-            today = now.date()
-            
-            if word_data.get('mastered', False):
-                # 已掌握的单词显示绿色
-                item_text = f"✅ {word}"
-            elif next_review_date <= today:
-                # 需要复习的单词显示红色（今天或过去的日期）
-                item_text = f"🔴 {word}"
-            else:
-                # 未来的日期，显示绿色（已掌握，待复习但时间未到）
-                item_text = f"✅ {word}"
-                
-            item = QListWidgetItem(item_text)
-            if i == self.word_manager.current_index:
-                item.setBackground(QColor(200, 220, 255))
-            self.word_list.addItem(item)
-        
-        # 恢复更新（如果之前暂停了）
-        if word_count > 1000:
-            self.word_list.setUpdatesEnabled(True)
+        # 显示当前单词卡片
+        if words:
+            self.show_current_card()
+        else:
+            self.word_card.set_word("", "请添加单词开始学习")
         
-        # 更新统计（使用数据库查询，避免遍历大量数据）
-        stats = self.db_manager.get_statistics()
+        self._update_nav_buttons()
+    
+    def _refresh_stats(self, tomorrow=None):
+        """更新统计标签和饼图（使用数据库查询，避免遍历大量数据；数据未变化时使用缓存）"""
+        if tomorrow is None:
+            tomorrow = day_start_timestamp(1)
+        stats = self._get_stats(tomorrow)
         
         total = stats['total']
         new_count = stats['new_count']
         review_count = stats['review_count']
-        mastered_count = stats['mastered_count']
         total_mastered = stats['total_mastered']
         
         # 更新统计饼图（用 total_mastered 表示“已掌握或暂不需复习”，评价后比例会立即变化）
         self.label_total_words.setText(f'共 {total} 个单词')
         self.pie_chart.set_data(total, new_count, review_count, total_mastered)
         self.legend_mastered.setText(f'■ 已掌握 {total_mastered}')
-        
-        # 显示当前单词卡片
-        if words:
-            self.show_current_card()
-        else:
-            self.word_card.set_word("", "请添加单词开始学习")
-        
-        # 更新上一个/下一个按钮状态
-        n = len(words)
+    
+    def _update_nav_buttons(self):
+        """更新上一个/下一个按钮状态"""
+        n = len(self.word_manager.words)
         idx = self.word_manager.current_index
         if hasattr(self, 'btn_prev') and hasattr(self, 'btn_next'):
             self.btn_prev.setEnabled(n > 1 and idx > 0)
             self.btn_next.setEnabled(n > 1 and idx < n - 1)
-            
+    
+    def _get_stats(self, tomorrow):
+        """获取统计信息：单词数据未变化且仍是同一天时直接返回上次的结果"""
+        if self._stats_dirty or self._stats_cache is None or self._stats_day != tomorrow:
+            self._stats_cache = self.db_manager.get_statistics()
+            self._stats_dirty = False
+            self._stats_day = tomorrow
+        return self._stats_cache
+    
+    def _update_stats_for_word(self, old_word, new_word):
+        """按单个单词状态的变化增量更新统计缓存（缓存无效时留待下次重新查询）"""
+        tomorrow = day_start_timestamp(1)
+        if self._stats_dirty or self._stats_cache is None or self._stats_day != tomorrow:
+            self._stats_dirty = True
+            return
+        
+        old_flags = self._word_stats_flags(old_word, tomorrow)
+        new_flags = self._word_stats_flags(new_word, tomorrow)
+        stats = dict(self._stats_cache)
+        for key, old_flag, new_flag in zip(
+                ('new_count', 'review_count', 'mastered_count', 'total_mastered'),
+                old_flags, new_flags):
+            stats[key] += new_flag - old_flag
+        self._stats_cache = stats
+    
+    @staticmethod
+    def _word_stats_flags(word_data, tomorrow):
+        """单个单词对各项统计的贡献（与 DatabaseManager.get_statistics 的条件一致）"""
+        mastered = bool(word_data.get('mastered'))
+        next_review = word_data.get('next_review')
+        return (
+            int(word_data.get('review_count', 0) == 0),
+            int(not mastered and (next_review is None or next_review < tomorrow)),
+            int(mastered),
+            int(mastered or (next_review is not None and next_review >= tomorrow)),
+        )
+    
     def show_current_card(self):
         """显示当前单词卡片"""
         if not self.word_manager.words:
@@ -637,22 +937,24 @@ class MainWindow(QMainWindow):
         if not word_data:
             return
             
+        # set_word 同时把卡片翻回单词面
         self.word_card.set_word(word_data['word'], word_data['meaning'])
-        self.word_card.reset_flip()
         
         # 高亮当前单词
-        if self.word_manager.current_index < self.word_list.count():
-            self.word_list.setCurrentRow(self.word_manager.current_index)
+        if self.word_manager.current_index < self.word_model.rowCount():
+            self.word_list.setCurrentIndex(self.word_model.index(self.word_manager.current_index))
         
-    def on_word_selected(self, item):
+    def on_word_selected(self, index):
         """单词列表项被选中"""
-        row = self.word_list.row(item)
+        row = index.row()
         self.word_manager.current_index = row
+        # 选择单词不改变数据：只更新卡片和按钮，选中行由视图自己高亮
         self.show_current_card()
+        self._update_nav_buttons()
     
-    def on_word_double_clicked(self, item):
+    def on_word_double_clicked(self, index):
         """单词列表项双击事件 - 编辑单词"""
-        row = self.word_list.row(item)
+        row = index.row()
         self.word_manager.current_index = row
         self.edit_word()
         
@@ -671,8 +973,9 @@ class MainWindow(QMainWindow):
         # 确保索引有效
         if self.word_manager.current_index < 0:
             self.word_manager.current_index = len(self.word_manager.words) - 1
+        # 切换单词不改变数据，只需更新卡片、选中行和按钮
         self.show_current_card()
-        self.update_display()
+        self._update_nav_buttons()
         
     def next_word(self):
         """下一个单词"""
@@ -682,8 +985,9 @@ class MainWindow(QMainWindow):
         # 确保索引有效
         if self.word_manager.current_index >= len(self.word_manager.words):
             self.word_manager.current_index = 0
+        # 切换单词不改变数据，只需更新卡片、选中行和按钮
         self.show_current_card()
-        self.update_display()
+        self._update_nav_buttons()
         
     def rate_word_forgot(self):
         """点击忘记按钮"""
@@ -691,15 +995,12 @@ class MainWindow(QMainWindow):
     
     def rate_word_mastered(self):
         """点击掌握按钮"""
-        self.statusBar().showMessage('正在处理掌握评价...', 1000)
-        QApplication.processEvents()
         self.rate_word(2)
     
     def rate_word(self, rating):
         """评价单词记忆情况 (1=忘记, 2=掌握)"""
         try:
             rating_text = ['', '忘记', '掌握'][rating]
-            self.statusBar().showMessage(f'正在评价: {rating_text}...')
             
             if not self.word_manager.words:
                 self.statusBar().showMessage('单词库为空')
@@ -722,30 +1023,34 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, '错误', f'单词 "{word}" 的ID无效')
                 return
                 
-            # 执行评价（更新数据库）
+            # 执行评价（更新数据库，并就地更新单词缓存中的这一项）
+            old_word = dict(word_data)
             self.word_manager.rate_word(rating)
+            words = self.word_manager.words
             
-            # 强制清除缓存，确保使用最新数据
-            self.word_manager._invalidate_cache()
+            # 统计按这个单词评价前后的变化增量更新，不再重新查询数据库
+            new_word = None
+            if current_idx < len(words) and words[current_idx].get('id') == word_id:
+                new_word = words[current_idx]
+                self._update_stats_for_word(old_word, new_word)
+            else:
+                self._stats_dirty = True
             
-            # 恢复当前索引（在重新加载数据之前）
-            # 先获取单词数量，避免加载全部数据
-            word_count = self.db_manager.get_word_count()
+            # 只刷新被评价的这一行和统计，不刷新整个列表
+            self.word_model.refresh_row(current_idx, new_word)
+            self._refresh_stats()
+            
+            # 恢复当前索引：单词数量取自单词列表缓存（随后切换下一张时同样需要），不再单独查询数据库
+            word_count = len(words)
             if current_idx < word_count:
                 self.word_manager.current_index = current_idx
             
-
-            # 立即更新显示（在切换到下一个单词之前）
-            self.update_display()
-            QApplication.processEvents()
-            
-            # 自动翻到下一张
-            QTimer.singleShot(500, self.next_word)
+            # 自动翻到下一张（在下一轮事件循环中切换，并与之合并为一次刷新）
+            QTimer.singleShot(0, self.next_word)
             
             # 数据库会自动保存，但确保索引已保存
             self.save_data()
             
-            rating_text = ['', '忘记', '掌握'][rating]
             self.statusBar().showMessage(f'已记录: {rating_text}')
         except Exception as e:
             QMessageBox.critical(self, '错误', f'评价单词时出错: {str(e)}')
@@ -760,13 +1065,14 @@ class MainWindow(QMainWindow):
                 return
             
             # 检查单词是否已存在
-            if self.db_manager.word_exists(word):
+            if self.word_manager.has_word(word):
                 QMessageBox.information(self, '提示', f'单词 "{word}" 已存在')
                 return
             
             word_id = self.word_manager.add_word(word, meaning)
             if word_id:
                 self.word_manager._invalidate_cache()  # 清除缓存
+                self._stats_dirty = True
                 self.save_data()
                 self.update_display()
                 self.statusBar().showMessage(f'已添加: {word}')
@@ -793,17 +1099,19 @@ class MainWindow(QMainWindow):
             if word_id:
                 # 检查是否与其他单词重复
                 existing_word = self.db_manager.get_word_by_id(word_id)
-                if existing_word and new_word.lower() != existing_word['word'].lower():
+                if existing_word and nocase_key(new_word) != nocase_key(existing_word['word']):
                     # 如果单词改变了，检查是否与其他单词重复
-                    if self.db_manager.word_exists(new_word):
+                    if self.word_manager.has_word(new_word):
                         QMessageBox.information(self, '提示', f'单词 "{new_word}" 已存在')
                         return
                 
-                # 更新单词和释义
-                self.db_manager.update_word(word_id, word=new_word, meaning=new_meaning)
-                self.word_manager._invalidate_cache()  # 清除缓存
+                # 更新单词和释义：只刷新这一行和卡片，统计不受影响
+                self.word_manager.update_word_text(word_id, new_word, new_meaning)
                 self.save_data()
-                self.update_display()
+                index = self.word_manager.index_of(word_id)
+                if index is not None:
+                    self.word_model.refresh_row(index, self.word_manager.words[index])
+                self.show_current_card()
                 self.statusBar().showMessage(f'已更新: {new_word}')
     
     def delete_word(self):
@@ -819,15 +1127,18 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
+            row = self.word_manager.current_index
             self.word_manager.delete_current_word()
+            self.word_model.remove_row(row)
             self.word_manager._invalidate_cache()  # 清除缓存
+            self._stats_dirty = True
             self.save_data()
             self.update_display()
             self.statusBar().showMessage('已删除')
     
     def clear_all_words(self):
         """清空单词库"""
-        count = self.db_manager.get_word_count()
+        count = len(self.word_manager.words)
         if count == 0:
             QMessageBox.information(self, '提示', '单词库已经是空的')
             return
@@ -839,13 +1150,17 @@ class MainWindow(QMainWindow):
         )
         if reply == QMessageBox.Yes:
             self.db_manager.clear_all_words()
-            self.word_manager._invalidate_cache()
+            self.word_manager.reset()
+            self._stats_dirty = True
             self.update_display()
             self.word_card.set_word('', '')
             self.statusBar().showMessage('已清空单词库')
             
     def import_words(self):
-        """导入单词"""
+        """导入单词（文件解析和写入在后台线程中进行）"""
+        if self._import_thread is not None:
+            return
+        
         file_path, _ = QFileDialog.getOpenFileName(
             self, '导入单词', '', 
             'Text Files (*.txt);;JSON Files (*.json);;All Files (*)'
@@ -853,58 +1168,58 @@ class MainWindow(QMainWindow):
         
         if not file_path:
             return
-            
-        try:
-            if file_path.endswith('.json'):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    words = data.get('words', [])
-            else:
-                # 文本格式：每行 "单词|释义" 或 "单词 释义"
-                words = []
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        if '|' in line:
-                            word, meaning = line.split('|', 1)
-                        else:
-                            parts = line.split(None, 1)
-                            if len(parts) >= 2:
-                                word, meaning = parts[0], parts[1]
-                            else:
-                                continue
-                        words.append({'word': word.strip(), 'meaning': meaning.strip()})
-            
-            count = 0
-            skipped = 0
-            for word_data in words:
-                if 'word' in word_data and 'meaning' in word_data:
-                    word = word_data['word'].strip()
-                    meaning = word_data['meaning'].strip()
-                    if word and meaning:
-                        if not self.db_manager.word_exists(word):
-                            self.word_manager.add_word(word, meaning)
-                            count += 1
-                        else:
-                            skipped += 1
-            
-            # 清除缓存以刷新显示
-            self.word_manager._invalidate_cache()
-            self.save_data()
-            self.update_display()
-            
-            if skipped > 0:
-                QMessageBox.information(self, '导入完成', f'成功导入 {count} 个单词\n跳过 {skipped} 个重复单词')
-            else:
-                QMessageBox.information(self, '导入成功', f'成功导入 {count} 个单词')
-            self.statusBar().showMessage(f'已导入 {count} 个单词')
-            
-        except Exception as e:
-            QMessageBox.critical(self, '导入失败', f'导入时出错: {str(e)}')
+        
+        self.btn_import.setEnabled(False)
+        self.statusBar().showMessage('正在导入...')
+        self._import_thread = ImportWordsThread(self.db_manager, file_path, self)
+        self._import_thread.progress.connect(self.on_import_progress)
+        self._import_thread.done.connect(self.on_import_done)
+        self._import_thread.failed.connect(self.on_import_failed)
+        self._import_thread.finished.connect(self._on_import_finished)
+        self._import_thread.start()
+    
+    def on_import_progress(self, processed):
+        """导入进度"""
+        self.statusBar().showMessage(f'正在导入... 已处理 {processed} 个单词')
+    
+    def on_import_done(self, count, skipped):
+        """导入完成"""
+        self._reload_after_import()
+        
+        if skipped > 0:
+            QMessageBox.information(self, '导入完成', f'成功导入 {count} 个单词\n跳过 {skipped} 个重复单词')
+        else:
+            QMessageBox.information(self, '导入成功', f'成功导入 {count} 个单词')
+        self.statusBar().showMessage(f'已导入 {count} 个单词')
+    
+    def on_import_failed(self, message):
+        """导入出错"""
+        # 出错前已提交的批次仍保留在数据库中，同样需要刷新显示
+        self._reload_after_import()
+        self.statusBar().showMessage('导入失败')
+        QMessageBox.critical(self, '导入失败', f'导入时出错，出错前已读取的单词已导入: {message}')
+    
+    def _reload_after_import(self):
+        """导入结束（成功或中途出错）后清除缓存，从数据库重新加载列表和统计"""
+        self.word_manager._invalidate_cache()
+        self._stats_dirty = True
+        self.save_data()
+        self.update_display()
+    
+    def _on_import_finished(self):
+        """导入线程结束，允许再次导入"""
+        self._import_thread.deleteLater()
+        self._import_thread = None
+        self.btn_import.setEnabled(True)
             
     def closeEvent(self, event):
         """关闭事件"""
+        # 等待尚未结束的 JSON 读取线程，避免线程对象在运行中被销毁
+        if self._json_probe is not None:
+            self._json_probe.wait()
+        # 等待进行中的导入完成，避免写入被中断
+        if self._import_thread is not None:
+            self._import_thread.wait()
         self.save_data()
+        self.db_manager.close()
         event.accept()
@@ -1,11 +1,18 @@
 """
 单词卡片组件 - 可翻转的卡片界面
 """
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
+from functools import lru_cache
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QStackedWidget
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 
 
+@lru_cache(maxsize=None)
+def card_font():
+    """卡片文字字体（只创建一次，单词面和释义面共用）"""
+    return QFont('Arial', 24, QFont.Bold)
+
+
 class WordCard(QWidget):
     """单词卡片组件"""
     card_flipped = pyqtSignal(bool)  # 卡片翻转信号
@@ -34,23 +41,21 @@ class WordCard(QWidget):
         self.is_flipped = False
         self.word = ""
         self.meaning = ""
+        self._shown_state = None  # 上次显示的 (是否有单词, 是否翻转)，状态不变时跳过更新
         self.init_ui()
         
     def init_ui(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
         
-        # 卡片容器（模拟卡片效果）
-        self.card_label = QLabel()
-        self.card_label.setAlignment(Qt.AlignCenter)
-        self.card_label.setWordWrap(True)
-        self.card_label.setCursor(Qt.PointingHandCursor)  # 鼠标悬停时显示手型光标
-        
-        # 设置字体
-        font = QFont('Arial', 24, QFont.Bold)
-        self.card_label.setFont(font)
-        
-        layout.addWidget(self.card_label)
+        # 卡片容器（模拟卡片效果）：单词面和释义面各用一个标签，样式只在创建时设置一次，
+        # 翻转时只切换显示的页面，不再重新设置（解析）样式表
+        self.word_label = self._create_card_label(self.CARD_WORD_STYLE)
+        self.meaning_label = self._create_card_label(self.CARD_MEANING_STYLE)
+        self.card_stack = QStackedWidget()
+        self.card_stack.addWidget(self.word_label)
+        self.card_stack.addWidget(self.meaning_label)
+        layout.addWidget(self.card_stack)
         
         # 提示文字
         self.hint_label = QLabel('点击卡片查看释义')
@@ -58,6 +63,16 @@ class WordCard(QWidget):
         self.hint_label.setStyleSheet("color: #5a5a5a; font-size: 13px;")
         layout.addWidget(self.hint_label)
     
+    def _create_card_label(self, style):
+        """创建卡片一面的标签"""
+        label = QLabel()
+        label.setAlignment(Qt.AlignCenter)
+        label.setWordWrap(True)
+        label.setCursor(Qt.PointingHandCursor)  # 鼠标悬停时显示手型光标
+        label.setFont(card_font())
+        label.setStyleSheet(style)
+        return label
+    
     def mousePressEvent(self, event):
         """鼠标点击事件 - 点击卡片区域即可翻转"""
         if self.word:  # 只有在有单词时才允许翻转
@@ -66,8 +81,13 @@ class WordCard(QWidget):
         
     def set_word(self, word, meaning):
         """设置单词和释义"""
-        self.word = word
-        self.meaning = meaning
+        # 同一个单词再次设置时（如重新选中当前行）不重新设置文字、不触发标签重新排版，
+        # 但仍然翻回单词面
+        if word != self.word or meaning != self.meaning:
+            self.word = word
+            self.meaning = meaning
+            self.word_label.setText(word if word else "暂无单词")
+            self.meaning_label.setText(meaning)
         self.reset_flip()
         
     def reset_flip(self):
@@ -83,18 +103,23 @@ class WordCard(QWidget):
         
     def update_display(self):
         """更新显示"""
+        # 页面和提示文字只取决于是否有单词、是否翻转（卡片文字由 set_word 设置）；
+        # 切换单词时通常两者都不变，无需再次设置
+        state = (bool(self.word), self.is_flipped)
+        if state == self._shown_state:
+            return
+        self._shown_state = state
+        
         if not self.word:
-            self.card_label.setText("暂无单词")
+            self.card_stack.setCurrentIndex(0)
             self.hint_label.setText("")
             return
             
         if self.is_flipped:
             # 显示释义
-            self.card_label.setText(self.meaning)
-            self.card_label.setStyleSheet(self.CARD_MEANING_STYLE)
+            self.card_stack.setCurrentIndex(1)
             self.hint_label.setText('点击卡片返回单词')
         else:
             # 显示单词
-            self.card_label.setText(self.word)
-            self.card_label.setStyleSheet(self.CARD_WORD_STYLE)
+            self.card_stack.setCurrentIndex(0)
             self.hint_label.setText('点击卡片查看释义')
@@ -3,9 +3,16 @@
 实现间隔重复算法（SM-2 算法）
 使用数据库存储
 """
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Set
 from datetime import datetime, timedelta
-from db_manager import DatabaseManager
+from db_manager import DatabaseManager, nocase_key
+
+
+# 前几次“掌握”后的固定复习间隔（天），按复习次数索引；之后按难度系数增长
+INITIAL_INTERVALS = (1, 1, 3, 7)
+# 难度系数的取值范围
+MIN_EASE_FACTOR = 1.3
+MAX_EASE_FACTOR = 2.5
 
 
 class WordManager:
@@ -14,7 +21,10 @@ class WordManager:
     def __init__(self, db_manager: Optional[DatabaseManager] = None) -> None:
         self.db_manager = db_manager or DatabaseManager()
         self._words_cache: Optional[List[Dict]] = None  # 缓存单词列表
+        self._word_keys: Optional[Set[str]] = None  # 缓存单词的查重键（用于查重）
+        self._id_index: Optional[Dict[int, int]] = None  # 缓存单词 ID -> 列表下标
         self._current_index: Optional[int] = None  # 缓存当前索引
+        self._index_dirty = False  # 当前索引已修改但尚未写入数据库
     
     @property
     def words(self) -> List[Dict]:
@@ -26,11 +36,13 @@ class WordManager:
     @words.setter
     def words(self, value: Optional[List[Dict]]) -> None:
         """设置单词列表（兼容原有接口）"""
-        self._words_cache = value
-        # 同步到数据库
+        # 同步到数据库：一次批量插入（单个事务），已存在的单词跳过
         if value:
-            for word_data in value:
-                self.db_manager.add_word(word_data['word'], word_data['meaning'])
+            self.db_manager.batch_add_words(
+                [(word_data['word'], word_data['meaning']) for word_data in value]
+            )
+        # 缓存从数据库重新加载，保证每个单词都带有 id 等完整字段
+        self._invalidate_cache()
     
     @property
     def current_index(self) -> int:
@@ -41,14 +53,61 @@ class WordManager:
     
     @current_index.setter
     def current_index(self, value: int) -> None:
-        """设置当前索引"""
-        self._current_index = value
-        self.db_manager.set_current_index(value)
+        """设置当前索引（只更新内存，由 flush_index 写入数据库，翻页时不必每次写库）"""
+        if value != self._current_index:
+            self._current_index = value
+            self._index_dirty = True
+    
+    def flush_index(self) -> None:
+        """将修改过的当前索引写入数据库"""
+        if self._index_dirty:
+            self._index_dirty = False
+            self.db_manager.set_current_index(self._current_index)
     
     def _invalidate_cache(self) -> None:
-        """使缓存失效"""
+        """使缓存失效（丢弃前先保存修改过的当前索引）"""
+        self.flush_index()
+        self._words_cache = None
+        self._word_keys = None
+        self._id_index = None
+        self._current_index = None
+    
+    def reset(self) -> None:
+        """数据库被清空后丢弃全部缓存，未保存的当前索引也一并丢弃（不写回数据库）"""
         self._words_cache = None
+        self._word_keys = None
+        self._id_index = None
         self._current_index = None
+        self._index_dirty = False
+    
+    def index_of(self, word_id: int) -> Optional[int]:
+        """根据单词 ID 查找其在单词列表中的下标（字典查找，随单词缓存一起失效）"""
+        if self._id_index is None:
+            self._id_index = {word_data['id']: i for i, word_data in enumerate(self.words)}
+        return self._id_index.get(word_id)
+    
+    def _mutate_word(self, index: int, **fields) -> None:
+        """
+        就地更新缓存中的一个单词（数据库已由调用方更新）
+        
+        只改动单个单词时不必丢弃整个缓存，下次访问 words 无需重新查询全部单词。
+        """
+        if self._words_cache is None or not 0 <= index < len(self._words_cache):
+            return
+        self._words_cache[index].update(fields)
+        if 'word' in fields:
+            self._word_keys = None
+    
+    def has_word(self, word: str) -> bool:
+        """
+        检查单词是否已存在（与数据库的唯一索引一致，只忽略 ASCII 字母的大小写）
+        
+        基于已加载的单词列表构建的集合做内存查找，不再逐次查询数据库；
+        集合随单词缓存一起失效。
+        """
+        if self._word_keys is None:
+            self._word_keys = {nocase_key(word_data['word']) for word_data in self.words}
+        return nocase_key(word.strip()) in self._word_keys
     
     def add_word(self, word: str, meaning: str) -> Optional[int]:
         """添加单词"""
@@ -56,19 +115,34 @@ class WordManager:
         self._invalidate_cache()
         return word_id
         
+    def update_word_text(self, word_id: int, word: str, meaning: str) -> None:
+        """修改单词和释义（就地更新缓存中的这一项，不重新加载整个单词列表）"""
+        self.db_manager.update_word(word_id, word=word, meaning=meaning)
+        index = self.index_of(word_id)
+        if index is None:
+            self._invalidate_cache()
+        else:
+            self._mutate_word(index, word=word, meaning=meaning)
+        
     def get_current_word(self) -> Optional[Dict]:
         """获取当前单词"""
         words = self.words
         if not words:
             return None
+        return words[self._get_valid_index(len(words))]
+    
+    def _get_valid_index(self, word_count: int) -> int:
+        """
+        返回有效范围内的当前索引（word_count 需大于 0）
         
-        # 确保索引在有效范围内
-        if self.current_index < 0 or self.current_index >= len(words):
-            self.current_index = 0
-        
-        if self.current_index < len(words):
-            return words[self.current_index]
-        return None
+        越界时修正为 0 并保存在内存中（只标记待写入，由 flush_index 统一写库），
+        之后的访问不必再次修正。
+        """
+        index = self.current_index
+        if 0 <= index < word_count:
+            return index
+        self.current_index = 0
+        return 0
         
     def prev_word(self) -> None:
         """上一个单词"""
@@ -112,14 +186,8 @@ class WordManager:
         if not words:
             return
         
-        # 确保索引在有效范围内
-        if self.current_index < 0 or self.current_index >= len(words):
-            self.current_index = 0
-        
-        if self.current_index >= len(words):
-            return
-            
-        word_data = words[self.current_index]
+        index = self._get_valid_index(len(words))
+        word_data = words[index]
         word_id = word_data.get('id')
         if not word_id:
             return
@@ -130,67 +198,77 @@ class WordManager:
         interval = word_data.get('interval', 1)
         mastered = word_data.get('mastered', False)
         
+        # 当前时间只取一次，复习时间和最后复习时间都由它推算
+        now = datetime.now()
+        
         # 简化的间隔重复算法
         if quality == 1:  # 忘记
             # 重置间隔，降低难度系数
             interval = 1
-            ease_factor = max(1.3, ease_factor - 0.2)
+            ease_factor = max(MIN_EASE_FACTOR, ease_factor - 0.2)
             mastered = False
-            next_review = (datetime.now() - timedelta(days=1)).isoformat()
+            next_review = int((now - timedelta(days=1)).timestamp())
         else:  # 掌握 (quality == 2)
-            # 根据复习次数增加间隔
-            if review_count == 1:
-                interval = 1
-            elif review_count == 2:
-                interval = 3
-            elif review_count == 3:
-                interval = 7
+            # 根据复习次数增加间隔：前三次查表，之后按难度系数增长
+            if review_count < len(INITIAL_INTERVALS):
+                interval = INITIAL_INTERVALS[review_count]
             else:
                 interval = int(interval * ease_factor)
             
-            ease_factor = min(2.5, ease_factor + 0.15)
+            ease_factor = min(MAX_EASE_FACTOR, ease_factor + 0.15)
             
             if interval >= 30 and review_count >= 5:
                 mastered = True
             
-            next_review = (datetime.now() + timedelta(days=interval)).isoformat()
+            next_review = int((now + timedelta(days=interval)).timestamp())
+        
+        last_review = int(now.timestamp())
         
-        last_review = datetime.now().isoformat()
+        # 更新数据库：单词状态和学习记录在同一个事务中写入
+        with self.db_manager.transaction():
+            self.db_manager.update_word(
+                word_id,
+                review_count=review_count,
+                ease_factor=ease_factor,
+                interval_days=interval,
+                next_review=next_review,
+                mastered=1 if mastered else 0,
+                last_review=last_review
+            )
+            
+            # 添加学习记录
+            self.db_manager.add_review_record(word_id, quality, now)
+            
+            # 顺便保存当前索引
+            self.flush_index()
         
-        # 更新数据库
-        self.db_manager.update_word(
-            word_id,
+        # 就地更新缓存中的这个单词，不重新加载整个单词列表
+        self._mutate_word(
+            index,
             review_count=review_count,
             ease_factor=ease_factor,
-            interval_days=interval,
+            interval=interval,
             next_review=next_review,
-            mastered=1 if mastered else 0,
-            last_review=last_review
+            mastered=mastered,
+            last_review=last_review,
+            updated_at=last_review
         )
-        
-        # 添加学习记录
-        self.db_manager.add_review_record(word_id, quality)
-        
-        # 使缓存失效
-        self._invalidate_cache()
             
     def get_words_to_review(self) -> List[Dict]:
         """获取需要复习的单词"""
-        words = self.words
-        now = datetime.now()
-        result = []
-        for w in words:
-            next_review_str = w.get('next_review')
-            if next_review_str:
-                try:
-                    next_review_dt = datetime.fromisoformat(next_review_str) if isinstance(next_review_str, str) else next_review_str
-                    if next_review_dt <= now and not w.get('mastered', False):
-                        result.append(w)
-                except (ValueError, TypeError):
-                    pass
-        return result
+        # next_review 已是整数时间戳，直接与当前时间比较，无需解析日期字符串
+        now = int(datetime.now().timestamp())
+        # 单词列表尚未加载时直接在数据库中按索引筛选，不为此加载全部单词
+        if self._words_cache is None:
+            return self.db_manager.get_due_words(now)
+        return [
+            w for w in self.words
+            if not w['mastered'] and w['next_review'] is not None and w['next_review'] <= now
+        ]
         
     def get_new_words(self) -> List[Dict]:
         """获取新单词（未复习过的）"""
-        words = self.words
-        return [w for w in words if w.get('review_count', 0) == 0]
+        if self._words_cache is None:
+            return self.db_manager.get_new_words()
+        # review_count 总是整数（列默认 0），直接索引，不再经过 dict.get 的默认值
+        return [w for w in self.words if w['review_count'] == 0]